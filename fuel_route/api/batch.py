@@ -0,0 +1,229 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.conf import settings
+from django.db import connections
+
+from . import metrics
+from .geometry import METERS_PER_MILE
+from .http_client import UpstreamRejected, UpstreamUnavailable
+from .planner import RefuelPlanError
+from .quantize import normalize_endpoint, normalize_endpoints
+from .serializers import RouteRequestSerializer
+from .services import get_route_plan, get_route_response, shape_route_response
+from .station_index import get_station_index
+
+VEHICLE_FIELDS = ('tank_size', 'mpg', 'start_fuel')
+
+
+def prepare_lane(lane, vehicle):
+    """
+    Validate a lane like a single route request and normalize its endpoints.
+
+    :param lane: Dict with 'start' and 'end', optionally overriding the vehicle fields.
+    :param vehicle: Batch-wide defaults for 'tank_size', 'mpg' and 'start_fuel'.
+    :return: Tuple (route key, errors): the key (start, end, tank_size, mpg, start_fuel)
+             identifies lanes with the same result, errors is None unless the lane is invalid.
+    """
+    data = {field: value for field, value in vehicle.items() if value is not None}
+    data.update({field: lane[field] for field in ('start', 'end') + VEHICLE_FIELDS if field in lane})
+    serializer = RouteRequestSerializer(data=data)
+    if not serializer.is_valid():
+        return None, serializer.errors
+
+    validated = serializer.validated_data
+    start, end = normalize_endpoints(validated['start'], validated['end'])
+    start_fuel = validated.get('start_fuel')
+    if start_fuel is None:
+        start_fuel = validated['tank_size']
+    return (tuple(start), tuple(end), validated['tank_size'], validated['mpg'], start_fuel), None
+
+
+def route_outcome(compute):
+    """
+    Run `compute` on an executor thread and report its result the way the
+    single route endpoint would.
+
+    Django only closes the database connections of request threads, so those
+    `compute` opened on this thread (e.g. corridor queries with
+    FUEL_STATION_SOURCE 'database') are closed when it returns.
+
+    :return: Tuple (status, body): ('ok', response dict) or ('error', error message).
+    """
+    try:
+        response = compute()
+    except RefuelPlanError as exc:
+        return 'error', str(exc)
+    except UpstreamUnavailable:
+        return 'error', 'The routing service is unavailable, please retry later'
+    except UpstreamRejected as exc:
+        return 'error', f'The routing service rejected the request ({exc.status_code})'
+    except Exception:
+        metrics.increment('route_batch.unexpected_errors')
+        return 'error', 'Internal error while planning the route'
+    finally:
+        connections.close_all()
+    if response is None:
+        return 'error', 'Unable to find a route'
+    return 'ok', response
+
+
+def route_batch(lanes, vehicle, options=None, concurrency=None):
+    """
+    Plan many lanes, yielding each lane's result as soon as it is ready.
+
+    Lanes are validated and normalized concurrently, then lanes with the same
+    normalized endpoints and vehicle are planned once. Up to `concurrency`
+    routes are fetched and planned at a time, all against the station index
+    current when the batch started, so a price import mid-batch cannot mix
+    dataset versions in one batch.
+
+    :param lanes: List of lane dicts (see `prepare_lane`); an optional 'id' is echoed back.
+    :param vehicle: Batch-wide vehicle defaults.
+    :param options: Response options ('geometry', 'simplify', 'fields') of every lane,
+                    passed to `get_route_response`.
+    :return: Iterator of result dicts with the lane's 'index' and 'id' and either
+             'status': 'ok' with the 'route' response or 'status': 'error' with an
+             'error', followed by a final dict holding the batch 'summary'.
+    """
+    started = time.perf_counter()
+    concurrency = concurrency or settings.ROUTE_BATCH_CONCURRENCY
+    station_index = get_station_index() if settings.FUEL_STATION_SOURCE == 'index' else None
+    lanes_by_key = {}
+    succeeded = failed = 0
+
+    def result(index, status, body):
+        return {
+            'index': index, 'id': lanes[index].get('id'), 'status': status,
+            'route' if status == 'ok' else 'error': body,
+        }
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='route-batch')
+    try:
+        prepared = executor.map(lambda lane: prepare_lane(lane, vehicle), lanes)
+        for index, (key, errors) in enumerate(prepared):
+            if errors is not None:
+                failed += 1
+                yield result(index, 'error', errors)
+            else:
+                lanes_by_key.setdefault(key, []).append(index)
+
+        futures = {
+            executor.submit(
+                route_outcome,
+                lambda key=key: get_route_response(
+                    list(key[0]), list(key[1]), tank_size=key[2], mpg=key[3], start_fuel=key[4],
+                    station_index=station_index, normalized=True, **(options or {}),
+                ),
+            ): key
+            for key in lanes_by_key
+        }
+        for future in as_completed(futures):
+            status, body = future.result()
+            for index in lanes_by_key[futures[future]]:
+                if status == 'ok':
+                    succeeded += 1
+                else:
+                    failed += 1
+                yield result(index, status, body)
+    finally:
+        # Stop planning lanes nobody will read if the client went away
+        executor.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - started
+    metrics.increment('route_batch.lanes', len(lanes))
+    metrics.increment('route_batch.routes', len(lanes_by_key))
+    yield {'summary': {
+        'lanes': len(lanes),
+        'unique_routes': len(lanes_by_key),
+        'succeeded': succeeded,
+        'failed': failed,
+        'seconds': round(elapsed, 3),
+    }}
+
+
+def route_matrix(origins, destinations, vehicle, include_geometry=False, concurrency=None):
+    """
+    Fuel cost, distance and duration of the route from every origin to every destination.
+
+    Endpoints are normalized once each, identical cells are planned once, and
+    up to `concurrency` cells are fetched and planned at a time against one
+    station index, through the same cached pipeline as single routes (so legs
+    already routed or planned are not computed again).
+
+    :param origins: List of [longitude, latitude] (already validated).
+    :param destinations: List of [longitude, latitude] (already validated).
+    :param vehicle: Dict with 'tank_size', 'mpg' and 'start_fuel' (None for a full tank).
+    :param include_geometry: Also return every cell's full route response.
+    :return: Dict of N x M matrices 'costs' (dollars), 'distances' (miles) and
+             'durations' (seconds), None where a cell failed, the 'errors' of failed
+             cells, and 'routes' if `include_geometry` is set.
+    """
+    started = time.perf_counter()
+    concurrency = concurrency or settings.ROUTE_BATCH_CONCURRENCY
+    station_index = get_station_index() if settings.FUEL_STATION_SOURCE == 'index' else None
+    tank_size, mpg = vehicle['tank_size'], vehicle['mpg']
+    start_fuel = vehicle.get('start_fuel')
+    if start_fuel is None:
+        start_fuel = tank_size
+
+    def plan_cell(start, end):
+        # The plan carries the route's distance and duration: without geometry,
+        # a cell whose plan is cached does not touch the route at all
+        plan, route = get_route_plan(
+            list(start), list(end), tank_size=tank_size, mpg=mpg, start_fuel=start_fuel,
+            station_index=station_index, normalized=True,
+        )
+        if plan is None:
+            return None
+        return plan, shape_route_response(plan, route) if include_geometry else None
+
+    costs = [[None] * len(destinations) for _ in origins]
+    distances = [[None] * len(destinations) for _ in origins]
+    durations = [[None] * len(destinations) for _ in origins]
+    routes = [[None] * len(destinations) for _ in origins] if include_geometry else None
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='route-matrix') as executor:
+        points = [
+            tuple(point) for point in executor.map(normalize_endpoint, list(origins) + list(destinations))
+        ]
+        origin_points, destination_points = points[:len(origins)], points[len(origins):]
+
+        cells_by_pair = {}
+        for i, start in enumerate(origin_points):
+            for j, end in enumerate(destination_points):
+                if start == end:
+                    costs[i][j] = distances[i][j] = durations[i][j] = 0
+                else:
+                    cells_by_pair.setdefault((start, end), []).append((i, j))
+
+        futures = {
+            executor.submit(route_outcome, lambda pair=pair: plan_cell(*pair)): pair
+            for pair in cells_by_pair
+        }
+        for future in as_completed(futures):
+            status, body = future.result()
+            for i, j in cells_by_pair[futures[future]]:
+                if status != 'ok':
+                    errors.append({'origin': i, 'destination': j, 'error': body})
+                    continue
+                plan, response = body
+                costs[i][j] = plan['total_fuel_cost']
+                distances[i][j] = round(plan['distance'] / METERS_PER_MILE, 2)
+                durations[i][j] = round(plan['duration'])
+                if include_geometry:
+                    routes[i][j] = response
+
+    metrics.increment('route_matrix.cells', len(origins) * len(destinations))
+    metrics.increment('route_matrix.routes', len(cells_by_pair))
+    matrix = {
+        'costs': costs,
+        'distances': distances,
+        'durations': durations,
+        'errors': sorted(errors, key=lambda error: (error['origin'], error['destination'])),
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    if include_geometry:
+        matrix['routes'] = routes
+    return matrix
@@ -0,0 +1,162 @@
+import re
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+
+from .geocoding import GeocodeResult
+
+
+def normalize_address(street, city, state):
+    """
+    Build the cache key for an address: "street, city, state", lowercased, with
+    punctuation other than '&' and '#' dropped and whitespace collapsed.
+    """
+    parts = []
+    for part in (street, city, state):
+        part = re.sub(r"[^\w\s&#-]", " ", str(part).lower())
+        parts.append(" ".join(part.split()))
+    return ", ".join(parts)
+
+
+class GeocodeCache:
+    """
+    Persistent geocode results in a SQLite file, keyed by normalized address.
+
+    Each entry records the coordinates, the provider that found them, its
+    confidence and when the address was geocoded. Addresses no provider could
+    find are remembered as misses, with when they were last tried, so they are
+    not geocoded again on every import. The file is self-contained, so it can
+    be copied between environments or merged with `merge`.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS geocodes ("
+            "address TEXT PRIMARY KEY, lat REAL NOT NULL, lon REAL NOT NULL, "
+            "provider TEXT, confidence REAL, geocoded_at TEXT NOT NULL)"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS misses (address TEXT PRIMARY KEY, geocoded_at TEXT NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, address):
+        """
+        :param address: Normalized address (see `normalize_address`).
+        :return: GeocodeResult, or None if the address is not cached.
+        """
+        return self.get_many([address]).get(address)
+
+    def get_many(self, addresses, batch_size=500):
+        """
+        Look up many normalized addresses.
+
+        :return: Dict of address -> GeocodeResult for the addresses found.
+        """
+        addresses = list(addresses)
+        found = {}
+        with self.lock:
+            for first in range(0, len(addresses), batch_size):
+                batch = addresses[first:first + batch_size]
+                rows = self.connection.execute(
+                    "SELECT address, lat, lon, provider, confidence FROM geocodes "
+                    f"WHERE address IN ({', '.join('?' * len(batch))})",
+                    batch,
+                )
+                for address, lat, lon, provider, confidence in rows:
+                    found[address] = GeocodeResult(lat, lon, provider, confidence)
+        return found
+
+    def put_many(self, results):
+        """
+        Store geocode results.
+
+        :param results: Iterable of (normalized address, GeocodeResult) pairs.
+        """
+        results = list(results)
+        geocoded_at = datetime.now(timezone.utc).isoformat()
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO geocodes "
+                "(address, lat, lon, provider, confidence, geocoded_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (address, result.lat, result.lon, result.provider, result.confidence, geocoded_at)
+                    for address, result in results
+                ],
+            )
+            self.connection.executemany(
+                "DELETE FROM misses WHERE address = ?", [(address,) for address, _ in results]
+            )
+            self.connection.commit()
+
+    def put(self, address, result):
+        self.put_many([(address, result)])
+
+    def put_misses(self, addresses):
+        """
+        Remember normalized addresses that no provider could find, as of now.
+        """
+        geocoded_at = datetime.now(timezone.utc).isoformat()
+        with self.lock:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO misses (address, geocoded_at) VALUES (?, ?)",
+                [(address, geocoded_at) for address in addresses],
+            )
+            self.connection.commit()
+
+    def recent_misses(self, addresses, max_age, batch_size=500):
+        """
+        The addresses among `addresses` that were missed less than `max_age` seconds ago.
+
+        :return: Set of normalized addresses.
+        """
+        cutoff = (datetime.now(timezone.utc) - timedelta(seconds=max_age)).isoformat()
+        addresses = list(addresses)
+        recent = set()
+        with self.lock:
+            for first in range(0, len(addresses), batch_size):
+                batch = addresses[first:first + batch_size]
+                rows = self.connection.execute(
+                    f"SELECT address FROM misses WHERE address IN ({', '.join('?' * len(batch))}) "
+                    "AND geocoded_at > ?",
+                    batch + [cutoff],
+                )
+                recent.update(address for address, in rows)
+        return recent
+
+    def merge(self, other_path):
+        """
+        Copy entries from another cache file, keeping existing entries on conflict.
+        Misses are copied too, unless this cache has located the address.
+
+        :return: Number of geocodes added.
+        """
+        with self.lock:
+            before = self.connection.total_changes
+            self.connection.execute("ATTACH DATABASE ? AS other", (str(other_path),))
+            try:
+                self.connection.execute("INSERT OR IGNORE INTO geocodes SELECT * FROM other.geocodes")
+                added = self.connection.total_changes - before
+                self.connection.execute("DELETE FROM misses WHERE address IN (SELECT address FROM geocodes)")
+                has_misses = self.connection.execute(
+                    "SELECT 1 FROM other.sqlite_master WHERE type = 'table' AND name = 'misses'"
+                ).fetchone()
+                if has_misses:
+                    self.connection.execute(
+                        "INSERT OR IGNORE INTO misses SELECT * FROM other.misses "
+                        "WHERE address NOT IN (SELECT address FROM geocodes)"
+                    )
+                self.connection.commit()
+            finally:
+                self.connection.execute("DETACH DATABASE other")
+            return added
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM geocodes").fetchone()[0]
+
+    def close(self):
+        self.connection.close()
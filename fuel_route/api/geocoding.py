@@ -0,0 +1,335 @@
+import hashlib
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+GeocodeResult = namedtuple('GeocodeResult', ['lat', 'lon', 'provider', 'confidence'])
+
+logger = logging.getLogger(__name__)
+
+
+class GeocodingUnavailable(Exception):
+    """Every provider failed with an error, so whether the address exists is unknown."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, holding at most `capacity`.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        """Take a token if one is available right now."""
+        with self.lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def wait_time(self):
+        """Seconds until a token becomes available."""
+        with self.lock:
+            self._refill()
+            return max(0.0, (1 - self.tokens) / self.rate)
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while not self.try_acquire():
+            time.sleep(self.wait_time())
+
+
+class ProviderStats:
+    """Request counters and latencies for one provider."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.successes = 0
+        self.misses = 0
+        self.failures = 0
+        self.latencies = []
+
+    def record(self, outcome, latency):
+        with self.lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            self.latencies.append(latency)
+
+    @property
+    def requests(self):
+        return self.successes + self.misses + self.failures
+
+    def summary(self, elapsed):
+        """One-line report of throughput, latency and failures."""
+        with self.lock:
+            latencies = sorted(self.latencies)
+        if latencies:
+            mean = sum(latencies) / len(latencies)
+            p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        else:
+            mean = p95 = 0.0
+        return (
+            f"{self.requests} requests ({self.requests / max(elapsed, 1e-9):.2f}/s), "
+            f"{self.successes} found, {self.misses} not found, {self.failures} failed, "
+            f"latency mean {mean * 1000:.0f} ms / p95 {p95 * 1000:.0f} ms"
+        )
+
+
+class GeocodingProvider:
+    """
+    Base class for geocoding providers.
+
+    Subclasses implement `geocode`, returning a GeocodeResult, None when the
+    address is not found, or raising one of `errors` on a transport or provider
+    error; any other exception is a bug and is not retried.
+    """
+    name = None
+    errors = (requests.RequestException,)
+
+    def __init__(self, rate=1.0, timeout=10):
+        """
+        :param rate: Maximum requests per second allowed by the provider.
+        :param timeout: Per-request timeout in seconds.
+        """
+        self.bucket = TokenBucket(rate)
+        self.timeout = timeout
+        self.stats = ProviderStats()
+
+    def geocode(self, address):
+        raise NotImplementedError
+
+
+class NominatimProvider(GeocodingProvider):
+    name = 'nominatim'
+
+    def __init__(self, domain='nominatim.openstreetmap.org', scheme='https', **kwargs):
+        super().__init__(**kwargs)
+        from geopy.exc import GeopyError
+        from geopy.geocoders import Nominatim
+        self.errors = (requests.RequestException, GeopyError)
+        self.geolocator = Nominatim(user_agent="fuel_price_importer", domain=domain, scheme=scheme)
+
+    def geocode(self, address):
+        location = self.geolocator.geocode(address, timeout=self.timeout)
+        if not location:
+            return None
+        return GeocodeResult(
+            location.latitude, location.longitude, self.name, location.raw.get('importance'),
+        )
+
+
+class OpenCageProvider(GeocodingProvider):
+    name = 'opencage'
+
+    def __init__(self, api_key=None, **kwargs):
+        super().__init__(**kwargs)
+        from geopy.exc import GeopyError
+        from geopy.geocoders import OpenCage
+        self.errors = (requests.RequestException, GeopyError)
+        self.geolocator = OpenCage(api_key=api_key)
+
+    def geocode(self, address):
+        location = self.geolocator.geocode(address, timeout=self.timeout)
+        if not location:
+            return None
+        # OpenCage rates confidence from 1 to 10
+        confidence = location.raw.get('confidence')
+        return GeocodeResult(
+            location.latitude, location.longitude, self.name,
+            confidence / 10 if confidence is not None else None,
+        )
+
+
+class LocationIQProvider(GeocodingProvider):
+    name = 'locationiq'
+
+    def __init__(self, api_key=None, base_url='https://us1.locationiq.com/v1/search.php', **kwargs):
+        super().__init__(**kwargs)
+        self.api_key = api_key
+        self.base_url = base_url
+        self.session = requests.Session()
+
+    def geocode(self, address):
+        response = self.session.get(
+            self.base_url,
+            params={'key': self.api_key, 'q': address, 'format': 'json'},
+            timeout=self.timeout,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        data = response.json()
+        if not data:
+            return None
+        return GeocodeResult(
+            float(data[0]['lat']), float(data[0]['lon']), self.name, data[0].get('importance'),
+        )
+
+
+class StubProvider(GeocodingProvider):
+    """
+    Offline provider for exercising the pipeline without network access.
+
+    Addresses resolve to fixed coordinates from `locations`, or else to a
+    deterministic point inside the continental U.S. derived from the address.
+    """
+    name = 'stub'
+
+    def __init__(self, locations=None, latency=0.0, failure_rate=0.0, miss_rate=0.0, **kwargs):
+        kwargs.setdefault('rate', 1000.0)
+        super().__init__(**kwargs)
+        self.locations = locations or {}
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.miss_rate = miss_rate
+
+    def geocode(self, address):
+        if self.latency:
+            time.sleep(self.latency)
+        if random.random() < self.failure_rate:
+            raise requests.ConnectionError(f"stub provider failure for {address!r}")
+        if random.random() < self.miss_rate:
+            return None
+        if address in self.locations:
+            lat, lon = self.locations[address]
+        else:
+            digest = hashlib.sha1(address.encode('utf-8')).digest()
+            lat = 25 + 24 * int.from_bytes(digest[:4], 'big') / 2 ** 32
+            lon = -124 + 57 * int.from_bytes(digest[4:8], 'big') / 2 ** 32
+        return GeocodeResult(lat, lon, self.name, 1.0)
+
+
+PROVIDERS = {
+    provider.name: provider
+    for provider in (NominatimProvider, OpenCageProvider, LocationIQProvider, StubProvider)
+}
+
+
+def build_providers(config):
+    """
+    Instantiate providers from settings.
+
+    :param config: List of dicts with a 'name' key (see PROVIDERS) plus constructor options.
+    :return: List of GeocodingProvider, in failover order.
+    """
+    providers = []
+    for options in config:
+        options = dict(options)
+        providers.append(PROVIDERS[options.pop('name')](**options))
+    return providers
+
+
+class GeocodingPipeline:
+    """
+    Geocodes many addresses concurrently across several rate-limited providers.
+
+    Each address goes to the first provider, in configured order, that has a
+    rate-limit token free, so all providers work in parallel at their own
+    rate. Provider errors are retried with jittered backoff; when a provider
+    keeps failing or does not know the address, the next one is tried.
+    """
+
+    def __init__(self, providers, workers=8, retries=2, backoff=0.5):
+        """
+        :param providers: GeocodingProvider instances in failover order.
+        :param workers: Number of addresses geocoded concurrently.
+        :param retries: Retries per provider after an error.
+        :param backoff: Base delay in seconds between retries.
+        """
+        self.providers = providers
+        self.workers = workers
+        self.retries = retries
+        self.backoff = backoff
+        self.started = None
+
+    def _acquire_provider(self, candidates):
+        """Pick the first candidate with a free token, else wait for the soonest one."""
+        for provider in candidates:
+            if provider.bucket.try_acquire():
+                return provider
+        provider = min(candidates, key=lambda provider: provider.bucket.wait_time())
+        provider.bucket.acquire()
+        return provider
+
+    def geocode(self, address):
+        """
+        Geocode one address with retries and provider failover.
+
+        :return: GeocodeResult, or None if no provider found the address.
+        :raises GeocodingUnavailable: If no provider answered, only failed.
+        """
+        remaining = list(self.providers)
+        answered = False
+        while remaining:
+            provider = self._acquire_provider(remaining)
+            remaining.remove(provider)
+            for attempt in range(self.retries + 1):
+                if attempt:
+                    time.sleep(self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+                    provider.bucket.acquire()
+                started = time.perf_counter()
+                try:
+                    result = provider.geocode(address)
+                except provider.errors as exc:
+                    provider.stats.record('failures', time.perf_counter() - started)
+                    if attempt == self.retries:
+                        logger.warning(
+                            "Geocoding %r with %s failed after %d attempts: %r",
+                            address, provider.name, attempt + 1, exc,
+                        )
+                    continue
+                if result is None:
+                    provider.stats.record('misses', time.perf_counter() - started)
+                    answered = True
+                    break
+                provider.stats.record('successes', time.perf_counter() - started)
+                return result
+        if not answered:
+            raise GeocodingUnavailable(f"No geocoding provider answered for {address!r}")
+        return None
+
+    def geocode_many(self, items):
+        """
+        Geocode many addresses concurrently.
+
+        :param items: Iterable of (key, address) pairs.
+        :return: Iterator of (key, address, result, error) in completion order: result is the
+                 GeocodeResult or None if the address was not found, error the
+                 GeocodingUnavailable raised if no provider answered (result is then None).
+        """
+        self.started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(self.geocode, address): (key, address) for key, address in items
+            }
+            for future in as_completed(futures):
+                key, address = futures[future]
+                try:
+                    result, error = future.result(), None
+                except GeocodingUnavailable as exc:
+                    result, error = None, exc
+                yield key, address, result, error
+
+    def report(self):
+        """
+        Per-provider throughput, latency and failure counts since `geocode_many` started.
+
+        :return: List of report lines.
+        """
+        elapsed = time.perf_counter() - (self.started or time.perf_counter())
+        return [f"{provider.name}: {provider.stats.summary(elapsed)}" for provider in self.providers]
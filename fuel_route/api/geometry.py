@@ -0,0 +1,281 @@
+from functools import cached_property
+
+import numpy as np
+import polyline
+
+EARTH_RADIUS_MILES = 3958.7613
+METERS_PER_MILE = 1609.344
+
+# WGS-84 ellipsoid
+WGS84_A = 6378137.0
+WGS84_F = 1 / 298.257223563
+WGS84_B = (1 - WGS84_F) * WGS84_A
+
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between arrays of points on a spherical earth.
+
+    :param lat1, lon1: Arrays of latitudes/longitudes (degrees) of the first points.
+    :param lat2, lon2: Arrays of latitudes/longitudes (degrees) of the second points.
+    :return: Array of distances in miles.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = (
+        np.sin((lat2 - lat1) / 2) ** 2
+        + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def ellipsoidal_miles(lat1, lon1, lat2, lon2, max_iterations=20, tolerance=1e-12):
+    """
+    Geodesic distance between arrays of points on the WGS-84 ellipsoid
+    (Vincenty's inverse formula, evaluated for all pairs at once).
+
+    Consecutive route vertices are never near-antipodal, so the iteration
+    converges in a handful of steps; it matches geopy's geodesic to well
+    under a metre per pair.
+
+    :param lat1, lon1: Arrays of latitudes/longitudes (degrees) of the first points.
+    :param lat2, lon2: Arrays of latitudes/longitudes (degrees) of the second points.
+    :return: Array of distances in miles.
+    """
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    L = lon2 - lon1
+    U1 = np.arctan((1 - WGS84_F) * np.tan(lat1))
+    U2 = np.arctan((1 - WGS84_F) * np.tan(lat2))
+    sin_u1, cos_u1 = np.sin(U1), np.cos(U1)
+    sin_u2, cos_u2 = np.sin(U2), np.cos(U2)
+
+    lam = L
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(max_iterations):
+            sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+            sin_sigma = np.sqrt(
+                (cos_u2 * sin_lam) ** 2
+                + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lam) ** 2
+            )
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lam
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+            sin_alpha = np.where(sin_sigma == 0, 0.0, cos_u1 * cos_u2 * sin_lam / sin_sigma)
+            cos2_alpha = 1 - sin_alpha ** 2
+            cos_2sm = np.where(
+                cos2_alpha == 0, 0.0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha
+            )
+            C = WGS84_F / 16 * cos2_alpha * (4 + WGS84_F * (4 - 3 * cos2_alpha))
+            lam_prev = lam
+            lam = L + (1 - C) * WGS84_F * sin_alpha * (
+                sigma + C * sin_sigma * (cos_2sm + C * cos_sigma * (-1 + 2 * cos_2sm ** 2))
+            )
+            if np.size(lam) == 0 or np.max(np.abs(lam - lam_prev)) < tolerance:
+                break
+
+    u2 = cos2_alpha * (WGS84_A ** 2 - WGS84_B ** 2) / WGS84_B ** 2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    delta_sigma = B * sin_sigma * (
+        cos_2sm + B / 4 * (
+            cos_sigma * (-1 + 2 * cos_2sm ** 2)
+            - B / 6 * cos_2sm * (-3 + 4 * sin_sigma ** 2) * (-3 + 4 * cos_2sm ** 2)
+        )
+    )
+    return WGS84_B * A * (sigma - delta_sigma) / METERS_PER_MILE
+
+
+DISTANCE_METHODS = {
+    'haversine': haversine_miles,
+    'ellipsoidal': ellipsoidal_miles,
+}
+
+
+class RouteGeometry:
+    """
+    A decoded route held as coordinate arrays plus a cumulative-mile array.
+
+    Built once per request from the route polyline; the stop search, the
+    distance and the fuel cost all read from the same instance instead of
+    recomputing point-to-point distances.
+    """
+
+    def __init__(self, lats, lons, method='haversine', cumulative_miles=None):
+        """
+        :param lats: Sequence of latitudes (degrees).
+        :param lons: Sequence of longitudes (degrees).
+        :param method: Distance model, 'haversine' or 'ellipsoidal'.
+        :param cumulative_miles: Precomputed cumulative distances, if already known.
+        :raises ValueError: If there are no points, or the method is unknown.
+        """
+        if method not in DISTANCE_METHODS:
+            raise ValueError(f"Unknown distance method: {method!r}")
+        self.lats = np.ascontiguousarray(lats, dtype=np.float64)
+        self.lons = np.ascontiguousarray(lons, dtype=np.float64)
+        if not len(self.lats):
+            raise ValueError("A route geometry needs at least one point")
+        self.method = method
+        if cumulative_miles is None:
+            cumulative_miles = self._cumulative_miles()
+        self.cumulative_miles = np.ascontiguousarray(cumulative_miles, dtype=np.float64)
+
+    @classmethod
+    def from_points(cls, points, method='haversine', cumulative_miles=None):
+        """
+        Build a geometry from a list of (latitude, longitude) tuples.
+        """
+        coords = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        return cls(coords[:, 0], coords[:, 1], method=method, cumulative_miles=cumulative_miles)
+
+    @classmethod
+    def from_polyline(cls, encoded, method='haversine', cumulative_miles=None):
+        """
+        Build a geometry from an encoded polyline (precision 5), as returned by ORS.
+        """
+        return cls.from_points(polyline.decode(encoded), method=method, cumulative_miles=cumulative_miles)
+
+    def _cumulative_miles(self):
+        cumulative = np.zeros(len(self.lats), dtype=np.float64)
+        if len(self.lats) > 1:
+            legs = DISTANCE_METHODS[self.method](
+                self.lats[:-1], self.lons[:-1], self.lats[1:], self.lons[1:]
+            )
+            np.cumsum(legs, out=cumulative[1:])
+        return cumulative
+
+    def __len__(self):
+        return len(self.lats)
+
+    @property
+    def total_miles(self):
+        """Total route length in miles."""
+        return float(self.cumulative_miles[-1]) if len(self.cumulative_miles) else 0.0
+
+    @property
+    def points(self):
+        """The route as a list of (latitude, longitude) tuples."""
+        return list(zip(self.lats.tolist(), self.lons.tolist()))
+
+    @property
+    def coordinates(self):
+        """The route as an (n, 2) array of (latitude, longitude) rows."""
+        return np.column_stack((self.lats, self.lons))
+
+    def simplify_indices(self, tolerance):
+        """
+        Ramer-Douglas-Peucker simplification of the route.
+
+        :param tolerance: Maximum deviation in degrees.
+        :return: Sorted array of the indices of the vertices to keep; the first
+                 and last vertex are always kept.
+        """
+        n = len(self)
+        if n < 3:
+            return np.arange(n)
+        x, y = self.lons, self.lats
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[-1] = True
+        stack = [(0, n - 1)]
+        while stack:
+            first, last = stack.pop()
+            if last - first < 2:
+                continue
+            dx, dy = x[last] - x[first], y[last] - y[first]
+            px, py = x[first + 1:last] - x[first], y[first + 1:last] - y[first]
+            norm = np.hypot(dx, dy)
+            if norm == 0:
+                deviation = np.hypot(px, py)
+            else:
+                deviation = np.abs(px * dy - py * dx) / norm
+            k = int(np.argmax(deviation))
+            if deviation[k] > tolerance:
+                split = first + 1 + k
+                keep[split] = True
+                stack.append((first, split))
+                stack.append((split, last))
+        return np.flatnonzero(keep)
+
+    def miles_at_fractions(self, indices, fractions):
+        """
+        Convert positions on a simplified copy of the route to route miles.
+
+        PostGIS' ST_LineLocatePoint reports a position as a fraction of the planar
+        (degree) length of the line it was given; this maps that fraction back
+        onto the cumulative miles of the full route.
+
+        :param indices: Vertex indices of the simplified line (see `simplify_indices`).
+        :param fractions: Array of fractions in [0, 1] along the simplified line.
+        :return: Array of mile positions along the route.
+        """
+        fractions = np.asarray(fractions, dtype=np.float64)
+        if len(indices) < 2:
+            return np.zeros_like(fractions)
+        planar = np.hypot(np.diff(self.lons[indices]), np.diff(self.lats[indices]))
+        planar_cumulative = np.concatenate(([0.0], np.cumsum(planar)))
+        target = np.clip(fractions, 0.0, 1.0) * planar_cumulative[-1]
+        k = np.clip(np.searchsorted(planar_cumulative, target, side='right') - 1, 0, len(planar) - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(planar[k] > 0, (target - planar_cumulative[k]) / planar[k], 0.0)
+        miles = self.cumulative_miles[indices]
+        return miles[k] + (miles[k + 1] - miles[k]) * t
+
+    @cached_property
+    def markers(self):
+        """Mile-marker index over this route, built on first use."""
+        return MileMarkerIndex(self)
+
+
+class MileMarkerIndex:
+    """
+    Position lookups along a route by mile marker.
+
+    Every lookup is a binary search over the route's cumulative-mile array,
+    so finding a position costs O(log n) regardless of where it is on the route.
+    """
+
+    def __init__(self, geometry):
+        self.geometry = geometry
+        self.cumulative_miles = geometry.cumulative_miles
+        self.total_miles = geometry.total_miles
+
+    def locate(self, miles):
+        """
+        Find the route segment containing each mile position.
+
+        :param miles: Scalar or array of mile positions; clamped to the route.
+        :return: Tuple (index, fraction) where the position lies `fraction` of
+                 the way from vertex `index` to vertex `index + 1`.
+        """
+        cumulative = self.cumulative_miles
+        miles = np.clip(np.asarray(miles, dtype=np.float64), 0.0, self.total_miles)
+        last_segment = max(len(cumulative) - 2, 0)
+        index = np.clip(np.searchsorted(cumulative, miles, side='right') - 1, 0, last_segment)
+        if len(cumulative) < 2:
+            return index, np.zeros_like(miles)
+        length = cumulative[index + 1] - cumulative[index]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fraction = np.where(length > 0, (miles - cumulative[index]) / length, 0.0)
+        return index, fraction
+
+    def positions_at(self, miles):
+        """
+        Interpolated coordinates at each of the given mile positions.
+
+        :param miles: Array of mile positions.
+        :return: Tuple (lats, lons) of arrays.
+        """
+        lats, lons = self.geometry.lats, self.geometry.lons
+        index, fraction = self.locate(miles)
+        if len(lats) < 2:
+            return lats[index], lons[index]
+        lat = lats[index] + (lats[index + 1] - lats[index]) * fraction
+        lon = lons[index] + (lons[index + 1] - lons[index]) * fraction
+        return lat, lon
+
+    def position_at(self, mile):
+        """
+        Interpolated coordinate at a mile position.
+
+        :param mile: Distance from the start of the route in miles.
+        :return: Tuple (latitude, longitude).
+        """
+        lat, lon = self.positions_at(mile)
+        return float(lat), float(lon)
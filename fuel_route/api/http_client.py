@@ -0,0 +1,203 @@
+import asyncio
+import random
+import threading
+import time
+import weakref
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from . import metrics
+
+# Responses worth retrying: rate limiting and transient gateway errors
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+class UpstreamUnavailable(Exception):
+    """An upstream service failed after retries, or its circuit breaker is open."""
+
+
+class UpstreamRejected(Exception):
+    """An upstream service answered with a non-retryable error status (e.g. 400 or 404)."""
+
+    def __init__(self, status_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while an upstream service is down.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    are refused for `reset_timeout` seconds. Then a single trial call is let
+    through: its success closes the circuit, its failure opens it again.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.trial_running = False
+        self.lock = threading.Lock()
+
+    def before_call(self):
+        """
+        :raises UpstreamUnavailable: If the circuit is open.
+        """
+        with self.lock:
+            if self.opened_at is None:
+                return
+            if not self.trial_running and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.trial_running = True
+                return
+        metrics.increment(f'{self.name}.short_circuited')
+        raise UpstreamUnavailable(f'{self.name} circuit is open')
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_running = False
+        metrics.set_gauge(f'{self.name}.open', 0)
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.trial_running or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    metrics.increment(f'{self.name}.opened')
+                self.opened_at = time.monotonic()
+            self.trial_running = False
+            is_open = self.opened_at is not None
+        metrics.set_gauge(f'{self.name}.open', int(is_open))
+
+
+class PooledHttpClient:
+    """
+    Long-lived JSON-over-HTTP client: a keep-alive connection pool shared by
+    all threads of the process, connect and read timeouts on every request,
+    jittered exponential backoff on transient failures and a circuit breaker.
+
+    Each attempt's latency is recorded in the `<name>.latency_seconds`
+    histogram, and its outcome in `<name>.requests.<outcome>` counters.
+
+    `apost_json` is the asyncio equivalent of `post_json`, on an httpx pool of
+    its own per event loop; both share the retry policy and circuit breaker.
+    """
+
+    def __init__(self, name, base_url, headers=None, pool_size=10, async_pool_size=100, connect_timeout=3.05,
+                 read_timeout=30, retries=2, backoff=0.25, failure_threshold=5, reset_timeout=30):
+        """
+        :param pool_size: Connections kept alive to the upstream host.
+        :param async_pool_size: Connections kept alive to the upstream host per event loop.
+        :param retries: Retries after a transport error (connection error, timeout...) or retryable status.
+        :param backoff: Base delay in seconds between retries.
+        """
+        self.name = name
+        self.base_url = base_url.rstrip('/')
+        self.timeout = (connect_timeout, read_timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.breaker = CircuitBreaker(f'{name}.circuit', failure_threshold, reset_timeout)
+        self.headers = dict(headers or {})
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.async_pool_size = async_pool_size
+        self._async_clients = weakref.WeakKeyDictionary()
+
+    def post_json(self, path, payload):
+        """
+        POST a JSON payload and return the decoded JSON response.
+
+        Only use this for idempotent requests, since failed attempts are retried.
+
+        :raises UpstreamUnavailable: If every attempt failed or the circuit is open.
+        :raises UpstreamRejected: On a non-retryable error status, which does not
+                                  count against the circuit breaker.
+        """
+        self.breaker.before_call()
+        url = f'{self.base_url}/{path.lstrip("/")}'
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            started = time.perf_counter()
+            try:
+                response = self.session.post(url, json=payload, timeout=self.timeout)
+            except requests.RequestException as exc:
+                self._record(started, 'failed')
+                error = exc
+                continue
+            if response.status_code in RETRY_STATUSES:
+                self._record(started, 'failed')
+                error = requests.HTTPError(f'{response.status_code} from {url}')
+                continue
+            return self._handle_response(started, url, response.status_code, response.json)
+
+        self.breaker.record_failure()
+        raise UpstreamUnavailable(f'{self.name} failed after {self.retries + 1} attempts: {error}') from error
+
+    async def apost_json(self, path, payload):
+        """
+        Asyncio version of `post_json`.
+        """
+        import httpx
+
+        self.breaker.before_call()
+        client = self._async_client()
+        url = f'{self.base_url}/{path.lstrip("/")}'
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                await asyncio.sleep(self.backoff * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            started = time.perf_counter()
+            try:
+                response = await client.post(url, json=payload)
+            except httpx.TransportError as exc:
+                self._record(started, 'failed')
+                error = exc
+                continue
+            if response.status_code in RETRY_STATUSES:
+                self._record(started, 'failed')
+                error = httpx.HTTPStatusError(
+                    f'{response.status_code} from {url}', request=response.request, response=response,
+                )
+                continue
+            return self._handle_response(started, url, response.status_code, response.json)
+
+        self.breaker.record_failure()
+        raise UpstreamUnavailable(f'{self.name} failed after {self.retries + 1} attempts: {error}') from error
+
+    def _async_client(self):
+        """The httpx client of the running event loop; connections cannot be shared between loops."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=httpx.Timeout(self.timeout[1], connect=self.timeout[0]),
+                limits=httpx.Limits(
+                    max_connections=self.async_pool_size, max_keepalive_connections=self.async_pool_size,
+                ),
+            )
+        return client
+
+    def _handle_response(self, started, url, status_code, json):
+        self._record(started, 'ok' if status_code < 400 else 'rejected')
+        # Any answer, even an error status, shows the upstream is up
+        self.breaker.record_success()
+        if status_code >= 400:
+            raise UpstreamRejected(status_code, f'{status_code} from {url}')
+        return json()
+
+    def _record(self, started, outcome):
+        metrics.observe(f'{self.name}.latency_seconds', time.perf_counter() - started)
+        metrics.increment(f'{self.name}.requests.{outcome}')
@@ -0,0 +1,67 @@
+import gzip
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from api import route_fixtures
+from api.renderers import ORJSONRenderer
+from api.route_cache import CachedRoute
+from api.services import format_route_geometry, simplify_route
+
+GEOMETRY_VARIANTS = (
+    ('coordinates', None),
+    ('coordinates', 0.001),
+    ('polyline', None),
+    ('polyline', 0.001),
+)
+
+
+class Command(BaseCommand):
+    help = 'Time JSON rendering of route responses and report their size with each content coding'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=50, help='Renders timed per variant')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        compression = settings.RESPONSE_COMPRESSION
+        try:
+            import brotli
+        except ImportError:
+            brotli = None
+
+        self.stdout.write(
+            f"{'route':<22}{'geometry':<22}{'renderer':<10}{'ms/render':>10}"
+            f"{'bytes':>10}{'gzip':>10}{'br':>10}"
+        )
+        for name in route_fixtures.available():
+            route = CachedRoute.from_directions(route_fixtures.load(name))
+            for geometry, simplify in GEOMETRY_VARIANTS:
+                label = geometry + (f' ~{simplify}' if simplify else '')
+                for renderer_name, renderer, build in (
+                    # DRF's renderer on the geometry lists it rendered before
+                    ('drf', JSONRenderer(), lambda: self._legacy_geometry(route, geometry, simplify)),
+                    ('orjson', ORJSONRenderer(), lambda: format_route_geometry(route, geometry, simplify)),
+                ):
+                    # Geometry rendering is timed too: it is part of serializing every response
+                    started = time.perf_counter()
+                    for _ in range(iterations):
+                        body = renderer.render({'route': build()})
+                    elapsed = (time.perf_counter() - started) / iterations
+
+                    gzipped = len(gzip.compress(body, compresslevel=compression['gzip_level']))
+                    brotlied = len(brotli.compress(body, quality=compression['brotli_quality'])) if brotli else '-'
+                    self.stdout.write(
+                        f"{name:<22}{label:<22}{renderer_name:<10}{elapsed * 1000:>10.2f}"
+                        f"{len(body):>10}{gzipped:>10}{brotlied:>10}"
+                    )
+
+    @staticmethod
+    def _legacy_geometry(route, geometry, simplify):
+        """The geometry as responses held it before: lists of (lat, lon) points."""
+        if geometry == 'polyline':
+            return format_route_geometry(route, geometry, simplify)
+        points = route.to_geometry(settings.ROUTE_DISTANCE_METHOD).points
+        return simplify_route(points, tolerance=simplify) if simplify else points
@@ -0,0 +1,78 @@
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Libraries that only the data import needs, and that should stay off the request path
+IMPORT_ONLY_MODULES = ('pandas', 'geopy', 'openrouteservice')
+
+# Boots Django like a worker does, then reports the process's peak memory
+BOOT_SCRIPT = """
+import resource, sys
+import django
+django.setup()
+import {module}
+sys.stdout.write(str(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+"""
+
+
+def parse_importtime(output):
+    """
+    Parse `python -X importtime` output.
+
+    :return: List of (depth, module name, cumulative import time in microseconds),
+             depth 0 for modules imported by the script itself.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative_us, name = line.split('|', 2)
+        if not cumulative_us.strip().isdigit():
+            # Header line
+            continue
+        # Nested imports are indented by 2 spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((depth, name.strip(), int(cumulative_us)))
+    return imports
+
+
+class Command(BaseCommand):
+    help = 'Measure worker boot time and memory with `python -X importtime` in a fresh interpreter'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--module', default=settings.ROOT_URLCONF,
+            help='Module imported after django.setup() (default: ROOT_URLCONF, which loads every view)',
+        )
+        parser.add_argument('--runs', type=int, default=3, help='Boots measured; the fastest is reported')
+        parser.add_argument('--top', type=int, default=15, help='Slowest top-level imports listed')
+
+    def handle(self, *args, **options):
+        best = None
+        for _ in range(options['runs']):
+            process = subprocess.run(
+                [sys.executable, '-X', 'importtime', '-c', BOOT_SCRIPT.format(module=options['module'])],
+                cwd=settings.BASE_DIR, capture_output=True, text=True,
+            )
+            if process.returncode:
+                raise CommandError(f'Boot failed:\n{process.stderr[-2000:]}')
+            imports = parse_importtime(process.stderr)
+            total = sum(cumulative for depth, _, cumulative in imports if depth == 0)
+            if best is None or total < best[0]:
+                # ru_maxrss is in kilobytes on Linux
+                best = (total, int(process.stdout), imports)
+
+        total, max_rss_kb, imports = best
+        self.stdout.write(f"Boot imports: {total / 1000:.1f} ms, peak RSS: {max_rss_kb / 1024:.1f} MB")
+        # Packages include the imports they trigger, so nested packages are counted in their parents too
+        packages = [(name, cumulative) for _, name, cumulative in imports if '.' not in name]
+        for name, cumulative in sorted(packages, key=lambda item: -item[1])[:options['top']]:
+            self.stdout.write(f"  {cumulative / 1000:>9.1f} ms  {name}")
+
+        loaded = [name for name in IMPORT_ONLY_MODULES if any(module == name for _, module, _ in imports)]
+        if loaded:
+            self.stdout.write(self.style.WARNING(f"Import-only libraries loaded at boot: {', '.join(loaded)}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"None of {', '.join(IMPORT_ONLY_MODULES)} loaded at boot"))
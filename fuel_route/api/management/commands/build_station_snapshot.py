@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from api.station_index import StationIndex
+
+
+class Command(BaseCommand):
+    help = 'Compile FuelPrice stations into a memory-mapped snapshot shared by all workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--path', default=settings.STATION_SNAPSHOT_PATH,
+            help='Snapshot file to write (default: STATION_SNAPSHOT_PATH)',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not path:
+            raise CommandError('No snapshot path given and STATION_SNAPSHOT_PATH is not set.')
+
+        index = StationIndex.from_database()
+        # Written to a temporary file and renamed, so running workers swap to it atomically
+        index.write_snapshot(path)
+        self.stdout.write(self.style.SUCCESS(
+            f'Wrote snapshot of {len(index)} stations (dataset version {index.version}) to {path}'
+        ))
@@ -1,72 +1,272 @@
-import requests
+import hashlib
+import io
 import time
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.contrib.gis.geos import Point
 from django.conf import settings
-from geopy.geocoders import OpenCage, Nominatim
-from api.models import FuelPrice
-from api.utils import load_cleaned_fuel_data
+from django.db import connection, transaction
+from api.geocode_cache import GeocodeCache, normalize_address
+from api.geocoding import GeocodingPipeline, build_providers
+from api.models import DatasetVersion, FuelPrice
+from api.utils import iter_cleaned_fuel_data, load_cleaned_fuel_data
+
+STAGING_TABLE = 'fuel_price_staging'
+
+
+def content_hash(city, retail_price):
+    """Hash of a station's non-key columns, used to detect changed rows."""
+    return hashlib.sha1(f"{city}|{float(retail_price)!r}".encode('utf-8')).hexdigest()
+
 
 class Command(BaseCommand):
     help = 'Import fuel price data into the FuelPrice model with geolocation'
 
-    def handle(self, *args, **kwargs):
-        nominatim_geolocator = Nominatim(user_agent="fuel_price_importer")    
-        opencage_geolocator = OpenCage(api_key=settings.OPEN_CAGE_API_KEY)
-        locationiq_base_url = f"https://us1.locationiq.com/v1/search.php?key={settings.LOCATIONIQ_API_KEY}"
+    def add_arguments(self, parser):
+        mode = parser.add_mutually_exclusive_group()
+        mode.add_argument(
+            '--bulk', action='store_true',
+            help='Stream the CSV through COPY and upsert all stations in one statement',
+        )
+        mode.add_argument(
+            '--incremental', action='store_true',
+            help='Diff the CSV against the stored stations and apply only the changes',
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=5000,
+            help='Rows read from the CSV per chunk in bulk and incremental modes',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Geocoded locations saved per bulk update',
+        )
+        parser.add_argument(
+            '--workers', type=int, default=settings.GEOCODING_WORKERS,
+            help='Addresses geocoded concurrently',
+        )
+        parser.add_argument(
+            '--geocode-cache', default=settings.GEOCODE_CACHE_PATH,
+            help='SQLite geocode cache consulted before any geocoding request',
+        )
+        parser.add_argument(
+            '--retry-misses', action='store_true',
+            help='Geocode addresses no provider could find again, however recently they were tried',
+        )
+        parser.add_argument(
+            '--merge-geocode-cache', metavar='PATH',
+            help='Merge entries from another geocode cache file (e.g. from another environment) first',
+        )
+
+    def handle(self, *args, **options):
+        providers = build_providers(
+            [{'timeout': settings.GEOCODING_TIMEOUT, **provider} for provider in settings.GEOCODING_PROVIDERS]
+        )
+        self.geocoder = GeocodingPipeline(
+            providers, workers=options['workers'], retries=settings.GEOCODING_RETRIES,
+        )
+        self.geocode_cache = GeocodeCache(options['geocode_cache'])
+        if options['merge_geocode_cache']:
+            merged = self.geocode_cache.merge(options['merge_geocode_cache'])
+            self.stdout.write(f"Merged {merged} geocodes from {options['merge_geocode_cache']}")
+
+        if options['incremental']:
+            changed = self.incremental_import(options['chunk_size'])
+        elif options['bulk']:
+            self.bulk_import(options['chunk_size'])
+            changed = True
+        else:
+            self.row_import()
+            changed = True
+        miss_retry_age = 0 if options['retry_misses'] else settings.GEOCODE_MISS_RETRY_AGE
+        changed = self.geocode_missing(options['batch_size'], miss_retry_age) > 0 or changed
+
+        if not changed:
+            self.stdout.write(self.style.SUCCESS(
+                f'Fuel data is up to date (dataset version {DatasetVersion.current()})'
+            ))
+            return
 
+        # Let workers know their station indexes are out of date
+        version = DatasetVersion.bump(DatasetVersion.FUEL_PRICES)
+        if settings.STATION_SNAPSHOT_PATH:
+            call_command('build_station_snapshot', stdout=self.stdout)
+        self.stdout.write(self.style.SUCCESS(f'Successfully imported fuel data with geolocation (dataset version {version})'))
+
+    def row_import(self):
         cleaned_data = load_cleaned_fuel_data()
-        
+
         for _, row in cleaned_data.iterrows():
-            address = f"{row['Address']}, {row['City']}, {row['State']}, USA"
-            
-            fuel_price, _ = FuelPrice.objects.get_or_create(
+            FuelPrice.objects.update_or_create(
                 truckstop_name=row['Truckstop Name'],
                 address=row['Address'],
                 state=row['State'],
-                retail_price=row['Retail Price']
+                defaults={'city': row['City'], 'retail_price': row['Retail Price']},
             )
 
-            print("Processing address:", address)
-
-            if fuel_price.location:
-                continue
-            
-            # use Nominatim for geocoding
-            try:
-                location = nominatim_geolocator.geocode(address, timeout=10)
-                if location:
-                    fuel_price.location = Point(location.longitude, location.latitude)
-                    fuel_price.save()
-                    time.sleep(1)
+    def incremental_import(self, chunk_size):
+        """
+        Diff the CSV against the stored stations by natural key and content hash,
+        then in one transaction update changed prices, insert new stations and
+        delete stations no longer in the file. Unchanged rows are not written and
+        existing locations are kept, so nothing already located is geocoded again.
+
+        :return: True if anything changed.
+        """
+        started = time.perf_counter()
+        incoming = {}
+        for chunk in iter_cleaned_fuel_data(chunk_size):
+            for name, street, city, state, price in chunk.itertuples(index=False, name=None):
+                # Rows repeating a key: the last one in the file wins, as in bulk mode
+                incoming[(name, street, state)] = (city, price)
+
+        with transaction.atomic():
+            existing = {
+                (name, street, state): (pk, content_hash(city, price))
+                for pk, name, street, state, city, price in
+                FuelPrice.objects.select_for_update().values_list(
+                    'id', 'truckstop_name', 'address', 'state', 'city', 'retail_price'
+                )
+            }
+            created, updated = [], []
+            for key, (city, price) in incoming.items():
+                if key not in existing:
+                    created.append(FuelPrice(
+                        truckstop_name=key[0], address=key[1], state=key[2], city=city, retail_price=price,
+                    ))
+                elif existing[key][1] != content_hash(city, price):
+                    updated.append(FuelPrice(id=existing[key][0], city=city, retail_price=price))
+            retired = [pk for key, (pk, _) in existing.items() if key not in incoming]
+
+            FuelPrice.objects.bulk_create(created, batch_size=1000)
+            FuelPrice.objects.bulk_update(updated, ['city', 'retail_price'], batch_size=1000)
+            FuelPrice.objects.filter(id__in=retired).delete()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"Compared {len(incoming)} stations in {elapsed:.2f}s: {len(created)} new, "
+            f"{len(updated)} changed, {len(retired)} retired, "
+            f"{len(incoming) - len(created) - len(updated)} unchanged"
+        )
+        return bool(created or updated or retired)
+
+    def bulk_import(self, chunk_size):
+        """
+        Stream the CSV into a staging table with COPY, then upsert every station
+        with a single INSERT ... ON CONFLICT on the (name, address, state) key.
+        Rows repeating a key are deduplicated in SQL, the last one in the file wins.
+        """
+        started = time.perf_counter()
+        rows = 0
+        table = FuelPrice._meta.db_table
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMP TABLE {STAGING_TABLE} ("
+                "seq bigint, truckstop_name text, address text, city text, state text, "
+                "retail_price double precision) ON COMMIT DROP"
+            )
+            for chunk in iter_cleaned_fuel_data(chunk_size):
+                chunk.insert(0, 'seq', chunk.index)
+                buffer = io.StringIO()
+                chunk.to_csv(buffer, header=False, index=False)
+                buffer.seek(0)
+                cursor.copy_expert(
+                    f"COPY {STAGING_TABLE} (seq, truckstop_name, address, city, state, retail_price) "
+                    "FROM STDIN WITH (FORMAT csv)",
+                    buffer,
+                )
+                rows += len(chunk)
+
+            cursor.execute(
+                f"INSERT INTO {table} (truckstop_name, address, city, state, retail_price) "
+                "SELECT DISTINCT ON (truckstop_name, address, state) "
+                "truckstop_name, address, city, state, retail_price "
+                f"FROM {STAGING_TABLE} "
+                "ORDER BY truckstop_name, address, state, seq DESC "
+                "ON CONFLICT (truckstop_name, address, state) DO UPDATE "
+                "SET retail_price = EXCLUDED.retail_price, city = EXCLUDED.city "
+                f"WHERE ({table}.retail_price, {table}.city) "
+                "IS DISTINCT FROM (EXCLUDED.retail_price, EXCLUDED.city) "
+                "RETURNING (xmax = 0)"
+            )
+            results = [inserted for inserted, in cursor.fetchall()]
+
+        elapsed = time.perf_counter() - started
+        inserted = sum(results)
+        self.stdout.write(
+            f"Upserted {rows} rows in {elapsed:.2f}s ({rows / max(elapsed, 1e-9):.0f} rows/s): "
+            f"{inserted} new stations, {len(results) - inserted} updated"
+        )
+
+    def geocode_missing(self, batch_size, miss_retry_age):
+        """
+        Locate every station without a location: first from the geocode cache,
+        then by geocoding the rest concurrently. Locations are saved with bulk
+        updates and new geocodes are added to the cache as they come in.
+        Addresses no provider found are cached as misses and skipped until
+        they are `miss_retry_age` seconds old.
+
+        :return: Number of stations located.
+        """
+        missing = [
+            (pk, street, city, state, normalize_address(street, city, state))
+            for pk, street, city, state in
+            FuelPrice.objects.filter(location=None).values_list('id', 'address', 'city', 'state')
+        ]
+        cached = self.geocode_cache.get_many({key for *_, key in missing})
+        from_cache = self.save_locations(
+            ((pk, cached[key]) for pk, *_, key in missing if key in cached), batch_size
+        )
+        self.stdout.write(f"Located {from_cache} stations from the geocode cache")
+
+        missed = self.geocode_cache.recent_misses(
+            {key for *_, key in missing if key not in cached}, miss_retry_age,
+        )
+        if missed:
+            self.stdout.write(f"Skipped {len(missed)} addresses no provider found recently (use --retry-misses)")
+
+        # Stations sharing an address are geocoded once
+        stations_by_key = {}
+        for pk, street, city, state, key in missing:
+            if key not in cached and key not in missed:
+                stations_by_key.setdefault(key, (f"{street}, {city}, {state}, USA", []))[1].append(pk)
+        addresses = ((key, address) for key, (address, _) in stations_by_key.items())
+
+        def located():
+            for key, address, result, error in self.geocoder.geocode_many(addresses):
+                if error is not None:
+                    # Providers failed: the address may exist, so it is tried again next import
+                    self.stdout.write(self.style.WARNING(f"Could not geocode (providers failed): {address}"))
                     continue
-            except Exception:
-                ...
-
-            # Use OpenCage geocoding
-            try:
-                location = opencage_geolocator.geocode(address, timeout=10)
-                if location:
-                    fuel_price.location = Point(location.longitude, location.latitude)
-                    fuel_price.save()
-                    time.sleep(1)
+                if result is None:
+                    self.stdout.write(self.style.WARNING(f"Could not geocode: {address}"))
+                    self.geocode_cache.put_misses([key])
                     continue
-            except Exception:
-                ...
-
-
-            # Use LocationIQ for geocoding
-            try:
-                response = requests.get(f"{locationiq_base_url}&q={address}&format=json")
-                if response.status_code == 200:
-                    data = response.json()
-                    if data:
-                        fuel_price.location = Point(data[0]["lon"], data[0]["lat"])
-                        fuel_price.save()
-                        time.sleep(1)
-                        continue
-            except Exception:
-                ...
-            self.stdout.write(self.style.WARNING(f"Could not geocode: {address}"))
-            
-        self.stdout.write(self.style.SUCCESS('Successfully imported fuel data with geolocation'))
+                self.geocode_cache.put(key, result)
+                for pk in stations_by_key[key][1]:
+                    yield pk, result
+
+        geocoded = self.save_locations(located(), batch_size)
+        self.stdout.write(f"Geocoded {geocoded} stations")
+        for line in self.geocoder.report():
+            self.stdout.write(f"  {line}")
+        return from_cache + geocoded
+
+    def save_locations(self, results, batch_size):
+        """
+        Save (station id, GeocodeResult) pairs with bulk updates.
+
+        :return: Number of stations updated.
+        """
+        batch = []
+        saved = 0
+        for pk, result in results:
+            batch.append(FuelPrice(id=pk, location=Point(result.lon, result.lat)))
+            if len(batch) >= batch_size:
+                FuelPrice.objects.bulk_update(batch, ['location'])
+                saved += len(batch)
+                batch = []
+        if batch:
+            FuelPrice.objects.bulk_update(batch, ['location'])
+            saved += len(batch)
+        return saved
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from api.services import route_cache
+
+
+class Command(BaseCommand):
+    help = 'Drop every cached route and route response, e.g. after switching routing providers or profiles'
+
+    def handle(self, *args, **options):
+        generation = route_cache.invalidate_all()
+        self.stdout.write(self.style.SUCCESS(
+            f'Invalidated cached routes (generation {generation}); '
+            f'workers stop serving them within {route_cache.generation_check_interval}s'
+        ))
@@ -0,0 +1,33 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from api.routing import OfflineBackend, RoutingStubServer
+
+
+class Command(BaseCommand):
+    help = 'Serve OpenRouteService-compatible directions locally from the offline routing backend'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default=settings.ROUTING_STUB_HOST)
+        parser.add_argument('--port', type=int, default=settings.ROUTING_STUB_PORT)
+        parser.add_argument(
+            '--latency', type=float, default=0.0,
+            help='Seconds each response is delayed, to simulate a remote provider',
+        )
+        parser.add_argument('--verbose-requests', action='store_true', help='Log every request')
+
+    def handle(self, *args, **options):
+        backend_options = {**settings.ROUTING_BACKENDS['offline'], 'latency': options['latency']}
+        backend_options.pop('backend')
+        server = RoutingStubServer(
+            (options['host'], options['port']), OfflineBackend(**backend_options),
+            verbose=options['verbose_requests'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Routing stub listening on http://{options['host']}:{options['port']} (Ctrl+C to stop)"
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,60 @@
+import bisect
+import threading
+from collections import defaultdict
+
+# Upper bounds (seconds) of latency histogram buckets; the last bucket is unbounded
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_lock = threading.Lock()
+_counters = defaultdict(int)
+_gauges = {}
+_histograms = {}
+
+
+def increment(name, value=1):
+    """Add `value` to a counter of this worker process."""
+    with _lock:
+        _counters[name] += value
+
+
+def set_gauge(name, value):
+    """Record the current value of a gauge of this worker process."""
+    with _lock:
+        _gauges[name] = value
+
+
+def observe(name, value, buckets=LATENCY_BUCKETS):
+    """
+    Record a sample (e.g. a latency in seconds) in a histogram of this worker process.
+
+    :param buckets: Sorted bucket upper bounds, used when the histogram is first created.
+    """
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = {
+                'buckets': tuple(buckets), 'counts': [0] * (len(buckets) + 1), 'sum': 0.0, 'count': 0,
+            }
+        histogram['counts'][bisect.bisect_left(histogram['buckets'], value)] += 1
+        histogram['sum'] += value
+        histogram['count'] += 1
+
+
+def snapshot():
+    """
+    Current values of this worker's metrics.
+
+    :return: Dict with 'counters' and 'gauges' mappings of name -> value, and
+             'histograms' mapping name -> {'buckets': {upper bound: cumulative count},
+             'sum', 'count'}, with '+Inf' as the bound of the last bucket.
+    """
+    with _lock:
+        histograms = {}
+        for name, histogram in _histograms.items():
+            bounds = [str(bound) for bound in histogram['buckets']] + ['+Inf']
+            cumulative, buckets = 0, {}
+            for bound, count in zip(bounds, histogram['counts']):
+                cumulative += count
+                buckets[bound] = cumulative
+            histograms[name] = {'buckets': buckets, 'sum': histogram['sum'], 'count': histogram['count']}
+        return {'counters': dict(_counters), 'gauges': dict(_gauges), 'histograms': histograms}
@@ -0,0 +1,95 @@
+import gzip
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured, MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from . import metrics
+
+
+def _gzip(content, options):
+    return gzip.compress(content, compresslevel=options['gzip_level'], mtime=0)
+
+
+def _brotli(content, options):
+    import brotli
+    return brotli.compress(content, quality=options['brotli_quality'])
+
+
+COMPRESSORS = {'br': _brotli, 'gzip': _gzip}
+
+
+def accepted_encodings(header):
+    """
+    Content codings an Accept-Encoding header allows, ignoring those with q=0.
+    """
+    encodings = set()
+    for item in header.split(','):
+        coding, *params = (part.strip() for part in item.split(';'))
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            encodings.add(coding.lower())
+    return encodings
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compress responses of at least RESPONSE_COMPRESSION['min_size'] bytes with
+    the first of RESPONSE_COMPRESSION['encodings'] the client accepts.
+
+    Unlike Django's GZipMiddleware it also speaks brotli, and smaller
+    responses, where compression costs more than it saves, are sent as is.
+    Streaming responses (NDJSON batches) are not compressed either, so their
+    lines still reach the client as soon as they are ready.
+    """
+
+    def __init__(self, get_response=None):
+        self.options = settings.RESPONSE_COMPRESSION
+        self.encodings = list(self.options['encodings'])
+        if not self.encodings:
+            raise MiddlewareNotUsed
+        unknown = set(self.encodings) - set(COMPRESSORS)
+        if unknown:
+            raise ImproperlyConfigured(f"Unknown response compression encodings: {sorted(unknown)}")
+        if 'br' in self.encodings:
+            try:
+                import brotli  # noqa: F401
+            except ImportError:
+                raise ImproperlyConfigured("Brotli response compression requires the brotli package")
+        super().__init__(get_response)
+
+    def process_response(self, request, response):
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        patch_vary_headers(response, ('Accept-Encoding',))
+        if len(response.content) < self.options['min_size']:
+            return response
+
+        accepted = accepted_encodings(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        encoding = next((encoding for encoding in self.encodings if encoding in accepted), None)
+        if encoding is None:
+            return response
+
+        original_size = len(response.content)
+        compressed = COMPRESSORS[encoding](response.content, self.options)
+        if len(compressed) >= original_size:
+            return response
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+        # The compressed body differs from the original, so a strong ETag no longer matches it
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+
+        metrics.increment(f'response_compression.{encoding}')
+        metrics.increment('response_compression.bytes_saved', original_size - len(compressed))
+        return response
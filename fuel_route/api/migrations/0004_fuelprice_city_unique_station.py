@@ -0,0 +1,48 @@
+# Generated by Django 3.2.23 on 2026-10-18 10:41
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def remove_duplicate_stations(apps, schema_editor):
+    """
+    Keep one row per (truckstop_name, address, state) before adding the unique
+    constraint: the most recent located row if there is one, else the most recent.
+    """
+    FuelPrice = apps.get_model('api', 'FuelPrice')
+    duplicates = (
+        FuelPrice.objects
+        .values('truckstop_name', 'address', 'state')
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+    )
+    for key in duplicates:
+        rows = list(
+            FuelPrice.objects
+            .filter(truckstop_name=key['truckstop_name'], address=key['address'], state=key['state'])
+            .order_by('-id')
+        )
+        keep = next((row for row in rows if row.location is not None), rows[0])
+        FuelPrice.objects.filter(
+            id__in=[row.id for row in rows if row.id != keep.id]
+        ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_datasetversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='fuelprice',
+            name='city',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.RunPython(remove_duplicate_stations, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='fuelprice',
+            constraint=models.UniqueConstraint(fields=('truckstop_name', 'address', 'state'), name='unique_fuelprice_station'),
+        ),
+    ]
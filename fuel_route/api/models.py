@@ -1,8 +1,43 @@
 from django.contrib.gis.db import models
+from django.db.models import F
+from django.utils import timezone
 
 class FuelPrice(models.Model):
     truckstop_name = models.CharField(max_length=255)
     address = models.TextField()
+    city = models.CharField(max_length=255, blank=True, default='')
     location = models.PointField(geography=True, null=True, blank=True)
     state = models.CharField(max_length=2)
     retail_price = models.FloatField()
+
+    class Meta:
+        constraints = [
+            # Natural key of a station; the bulk importer upserts on it
+            models.UniqueConstraint(
+                fields=['truckstop_name', 'address', 'state'], name='unique_fuelprice_station'
+            ),
+        ]
+
+
+class DatasetVersion(models.Model):
+    """
+    Version counter for a dataset, bumped on every import so that in-memory
+    indexes and caches built from it know when to rebuild.
+    """
+    FUEL_PRICES = 'fuel_prices'
+
+    name = models.CharField(max_length=50, unique=True)
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def current(cls, name=FUEL_PRICES):
+        """Return the current version of a dataset (0 if it was never imported)."""
+        return cls.objects.filter(name=name).values_list('version', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, name=FUEL_PRICES):
+        """Increment the version of a dataset and return the new version."""
+        cls.objects.get_or_create(name=name)
+        cls.objects.filter(name=name).update(version=F('version') + 1, updated_at=timezone.now())
+        return cls.current(name)
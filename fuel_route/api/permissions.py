@@ -0,0 +1,18 @@
+import hmac
+
+from django.conf import settings
+from rest_framework.permissions import BasePermission
+
+
+class HasMetricsToken(BasePermission):
+    """
+    Allows requests carrying METRICS_TOKEN as an `Authorization: Bearer <token>`
+    header, e.g. from a metrics scraper. Nobody is allowed while METRICS_TOKEN is unset.
+    """
+
+    def has_permission(self, request, view):
+        token = settings.METRICS_TOKEN
+        if not token:
+            return False
+        scheme, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+        return scheme.lower() == 'bearer' and hmac.compare_digest(credentials.strip().encode(), token.encode())
@@ -0,0 +1,120 @@
+from bisect import bisect_right
+from collections import namedtuple
+
+import numpy as np
+
+# A planned purchase: the station candidate, how much to buy there and what it costs
+Refuel = namedtuple('Refuel', ['station', 'gallons', 'cost'])
+
+# Slack for floating-point comparisons of fuel quantities (gallons)
+EPSILON = 1e-9
+
+
+class RefuelPlanError(Exception):
+    """Raised when the route cannot be driven with the stations available."""
+
+
+def _next_cheaper(prices):
+    """
+    For each node, the index of the first later node with a strictly lower price
+    (monotonic stack, O(n)). Nodes with no cheaper successor get len(prices).
+    """
+    result = [len(prices)] * len(prices)
+    stack = []
+    for i, price in enumerate(prices):
+        while stack and prices[stack[-1]] > price:
+            result[stack.pop()] = i
+        stack.append(i)
+    return result
+
+
+class _RangeMin:
+    """Sparse table answering "index of the cheapest node in [lo, hi]" in O(1)."""
+
+    def __init__(self, prices):
+        prices = np.asarray(prices, dtype=np.float64)
+        self.prices = prices
+        level = np.arange(len(prices))
+        self.levels = [level]
+        width = 1
+        while 2 * width <= len(prices):
+            left, right = level[:-width], level[width:]
+            level = np.where(prices[right] < prices[left], right, left)
+            self.levels.append(level)
+            width *= 2
+
+    def argmin(self, lo, hi):
+        k = (hi - lo + 1).bit_length() - 1
+        left = self.levels[k][lo]
+        right = self.levels[k][hi - (1 << k) + 1]
+        return int(right if self.prices[right] < self.prices[left] else left)
+
+
+def plan_refuelling(candidates, route_miles, tank_size=50, mpg=10, start_fuel=None):
+    """
+    Plan the cheapest set of fuel purchases for driving a route.
+
+    Classic greedy for the fixed-route gas station problem: at each station, if a
+    cheaper station is reachable on a full tank, buy just enough to get there;
+    otherwise fill up and drive to the cheapest station within range. Stations
+    are visited at most once, so planning is O(n log n) in the number of
+    candidates (dominated by sorting and the range-minimum table).
+
+    Detours to stations off the route are not counted against the range.
+
+    :param candidates: Station candidates with `mile` and `price` attributes.
+    :param route_miles: Total route length in miles.
+    :param tank_size: Tank capacity in gallons.
+    :param mpg: Fuel economy in miles per gallon.
+    :param start_fuel: Fuel in the tank at the start, in gallons (default: full tank).
+    :return: List of Refuel tuples in route order, one per station where fuel is bought.
+    :raises RefuelPlanError: If some stretch of the route is longer than the vehicle's range.
+    """
+    if start_fuel is None:
+        start_fuel = tank_size
+    max_range = tank_size * mpg
+
+    stations = sorted(
+        (candidate for candidate in candidates if 0 <= candidate.mile <= route_miles),
+        key=lambda candidate: candidate.mile,
+    )
+    # Node 0 is the origin (nothing to buy), the last node the destination (free)
+    miles = [0.0] + [station.mile for station in stations] + [route_miles]
+    prices = [float('inf')] + [station.price for station in stations] + [float('-inf')]
+    destination = len(miles) - 1
+
+    if (miles[1] - miles[0]) / mpg > start_fuel + EPSILON:
+        raise RefuelPlanError(
+            f"No fuel station reachable from the start with {start_fuel:g} gallons."
+        )
+    fuel = start_fuel - (miles[1] - miles[0]) / mpg
+
+    next_cheaper = _next_cheaper(prices)
+    range_min = _RangeMin(prices)
+    plan = []
+    node = 1
+    while node != destination:
+        cheaper = next_cheaper[node]
+        needed = (miles[cheaper] - miles[node]) / mpg
+        if needed <= tank_size + EPSILON:
+            # A cheaper station is within range: buy only what gets us there
+            purchase = max(0.0, needed - fuel)
+            target = cheaper
+        else:
+            # Everything in range is at least as expensive: fill up and go to the cheapest
+            purchase = tank_size - fuel
+            reach = bisect_right(miles, miles[node] + max_range) - 1
+            if reach <= node:
+                raise RefuelPlanError(
+                    f"No fuel station within {max_range:g} miles after mile {miles[node]:.0f}."
+                )
+            target = range_min.argmin(node + 1, reach)
+            needed = (miles[target] - miles[node]) / mpg
+
+        if purchase > EPSILON:
+            station = stations[node - 1]
+            plan.append(Refuel(station, purchase, purchase * station.price))
+        fuel += purchase - needed
+        node = target
+
+    return plan
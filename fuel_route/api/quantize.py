@@ -0,0 +1,146 @@
+import math
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from . import metrics
+from .geometry import haversine_miles, METERS_PER_MILE
+
+METERS_PER_DEGREE = 111_320
+
+# Previously routed endpoints kept per snapping cell
+MAX_ENDPOINTS_PER_CELL = 50
+ENDPOINT_TTL = 24 * 3600
+# A cell is updated under a lock in the shared cache, so concurrent updates are not lost.
+# Waiting longer than ENDPOINT_LOCK_WAIT seconds, the endpoint is routed without being remembered
+ENDPOINT_LOCK_TIMEOUT = 5
+ENDPOINT_LOCK_WAIT = 1
+ENDPOINT_LOCK_POLL_INTERVAL = 0.01
+
+
+def quantize_coordinate(coordinate, precision_m):
+    """
+    Snap a coordinate to a grid whose cells are about `precision_m` metres wide.
+
+    Coordinates are [longitude, latitude], the order the API and ORS use.
+    Latitude is snapped first, so the longitude step (which depends on
+    latitude) is the same for every point in a row of cells.
+
+    :return: Snapped [longitude, latitude].
+    """
+    lon, lat = coordinate
+    lat_step = precision_m / METERS_PER_DEGREE
+    lat = round(round(lat / lat_step) * lat_step, 7)
+    lon_step = lat_step / max(math.cos(math.radians(lat)), 1e-6)
+    lon = round(round(lon / lon_step) * lon_step, 7)
+    return [lon, lat]
+
+
+def snap_to_known_endpoint(coordinate, tolerance_m):
+    """
+    Replace a coordinate with a previously routed endpoint within `tolerance_m`,
+    or remember it as a new endpoint if there is none.
+
+    Known endpoints are kept in the shared cache, bucketed in cells the size of
+    the tolerance, so only the 3 x 3 cells around the coordinate are read.
+
+    :return: [longitude, latitude] to route from.
+    """
+    lon, lat = coordinate
+    step = tolerance_m / METERS_PER_DEGREE
+    row = math.floor(lat / step)
+
+    def column(r):
+        # Every cell in a row uses the longitude scale of the row's centre latitude,
+        # so points in the same row always agree on their column
+        scale = max(math.cos(math.radians((r + 0.5) * step)), 1e-6)
+        return math.floor(lon * scale / step)
+
+    own_key = f"endpoints:{tolerance_m}:{row}:{column(row)}"
+    keys = [
+        f"endpoints:{tolerance_m}:{r}:{c}"
+        for r in (row - 1, row, row + 1)
+        for c in (column(r) - 1, column(r), column(r) + 1)
+    ]
+    best, best_distance = _nearest_known_endpoint(cache.get_many(keys), lon, lat, tolerance_m)
+    if best is None:
+        best, best_distance = _add_known_endpoint(own_key, keys, lon, lat, tolerance_m)
+        if best is None:
+            return [lon, lat]
+
+    # A point matching a known endpoint exactly (e.g. one snapped before) is not moved
+    if best_distance > 0:
+        metrics.increment('directions.endpoint_snapped')
+    return list(best)
+
+
+def _nearest_known_endpoint(known, lon, lat, tolerance_m):
+    """
+    :param known: Dict of cell key -> list of known [longitude, latitude] endpoints.
+    :return: Tuple (nearest endpoint within `tolerance_m`, its distance in metres),
+             or (None, None) if there is none.
+    """
+    best, best_distance = None, tolerance_m
+    for endpoint in (point for points in known.values() for point in points):
+        distance = float(haversine_miles(lat, lon, endpoint[1], endpoint[0])) * METERS_PER_MILE
+        if distance <= best_distance:
+            best, best_distance = endpoint, distance
+    return (best, best_distance) if best is not None else (None, None)
+
+
+def _add_known_endpoint(own_key, keys, lon, lat, tolerance_m):
+    """
+    Remember [lon, lat] in its cell `own_key`, under the cell's lock.
+
+    Another worker may have remembered a matching endpoint since the cells were
+    read, so they are read again under the lock.
+
+    :return: Tuple (endpoint, distance) as returned by `_nearest_known_endpoint`:
+             (None, None) once [lon, lat] is remembered (or if the lock could not be taken).
+    """
+    lock_key = f"{own_key}:lock"
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + ENDPOINT_LOCK_WAIT
+    while not cache.add(lock_key, token, timeout=ENDPOINT_LOCK_TIMEOUT):
+        if time.monotonic() >= deadline:
+            metrics.increment('directions.endpoint_lock_timeout')
+            return None, None
+        time.sleep(ENDPOINT_LOCK_POLL_INTERVAL)
+
+    try:
+        known = cache.get_many(keys)
+        best, best_distance = _nearest_known_endpoint(known, lon, lat, tolerance_m)
+        if best is None:
+            points = known.get(own_key, [])[-(MAX_ENDPOINTS_PER_CELL - 1):]
+            cache.set(own_key, points + [[lon, lat]], timeout=ENDPOINT_TTL)
+        return best, best_distance
+    finally:
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def normalize_endpoint(coordinate):
+    """
+    Apply the DIRECTIONS_CACHE_QUANTIZATION policy to one [longitude, latitude] coordinate.
+    """
+    policy = settings.DIRECTIONS_CACHE_QUANTIZATION
+    coordinate = [float(value) for value in coordinate]
+    if policy.get('precision_m'):
+        coordinate = quantize_coordinate(coordinate, policy['precision_m'])
+    if policy.get('snap_tolerance_m'):
+        coordinate = snap_to_known_endpoint(coordinate, policy['snap_tolerance_m'])
+    return coordinate
+
+
+def normalize_endpoints(start, end):
+    """
+    Apply the DIRECTIONS_CACHE_QUANTIZATION policy to a route's endpoints, so that
+    nearly identical requests share one directions cache entry.
+
+    :param start: [longitude, latitude] of the start.
+    :param end: [longitude, latitude] of the destination.
+    :return: Tuple (start, end) of normalized coordinates.
+    """
+    return normalize_endpoint(start), normalize_endpoint(end)
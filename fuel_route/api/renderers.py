@@ -0,0 +1,36 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# NumPy arrays and scalars (route geometry, station prices) are serialized natively
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_fallback_encoder = JSONEncoder()
+
+
+def dumps(data, indent=False):
+    """
+    Serialize `data` to JSON bytes with orjson.
+
+    Types orjson does not support (Decimal, lazy translation strings,
+    querysets...) are converted the way DRF's JSONEncoder converts them.
+
+    :param indent: Pretty-print with an indent of 2 spaces.
+    """
+    option = ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else ORJSON_OPTIONS
+    return orjson.dumps(data, default=_fallback_encoder.default, option=option)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in replacement for DRF's JSONRenderer backed by orjson.
+
+    NaN and infinite floats are rendered as null, where JSONRenderer would
+    output invalid JSON, and any requested indent is rendered as 2 spaces.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=bool(indent))
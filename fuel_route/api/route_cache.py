@@ -0,0 +1,315 @@
+import struct
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+from django.core.cache import cache
+
+from . import metrics
+from .geometry import RouteGeometry
+
+# Compact cache entry layout: header, then the zlib-compressed geometry string
+# followed by the (optional) float64 cumulative-mile array
+ROUTE_MAGIC = b'FR'
+ROUTE_SCHEMA_VERSION = 3
+ROUTE_HEADER = struct.Struct('<2sBBddddI')
+DISTANCE_METHOD_CODES = {None: 0, 'haversine': 1, 'ellipsoidal': 2}
+DISTANCE_METHOD_NAMES = {code: name for name, code in DISTANCE_METHOD_CODES.items()}
+
+
+class CachedRoute:
+    """
+    The parts of an ORS directions response the pipeline uses: the encoded
+    geometry, the summary distance (metres) and duration (seconds), and
+    optionally the route's cumulative miles so they need not be recomputed.
+    `fresh_until` and `expires_at` (epoch seconds) are when the cached entry
+    becomes stale and when the shared cache entry expires.
+    """
+    __slots__ = (
+        'geometry', 'distance', 'duration', 'cumulative_miles', 'distance_method',
+        'fresh_until', 'expires_at', '_decoded',
+    )
+
+    def __init__(self, geometry, distance, duration, cumulative_miles=None, distance_method=None,
+                 fresh_until=0.0, expires_at=0.0):
+        self.geometry = geometry
+        self.distance = distance
+        self.duration = duration
+        self.cumulative_miles = cumulative_miles
+        self.distance_method = distance_method if cumulative_miles is not None else None
+        self.fresh_until = fresh_until
+        self.expires_at = expires_at
+        self._decoded = None
+
+    @classmethod
+    def from_directions(cls, directions, distance_method=None):
+        """
+        Extract the first route of an ORS directions response.
+
+        :param distance_method: If set, also precompute cumulative miles with this method.
+        :return: CachedRoute, or None if the response has no route (or an empty one).
+        """
+        if not directions or not directions.get('routes'):
+            return None
+        route = directions['routes'][0]
+        if not route.get('geometry'):
+            return None
+        summary = route.get('summary', {})
+        cumulative_miles = None
+        if distance_method:
+            cumulative_miles = RouteGeometry.from_polyline(
+                route['geometry'], method=distance_method
+            ).cumulative_miles
+        return cls(
+            route['geometry'], summary.get('distance', 0.0), summary.get('duration', 0.0),
+            cumulative_miles, distance_method,
+        )
+
+    def to_geometry(self, method):
+        """
+        Decode into a RouteGeometry, reusing the stored cumulative miles when they
+        were computed with the same distance method. The result is kept on the
+        route, so routes held in the local cache tier are decoded only once.
+        """
+        decoded = self._decoded
+        if decoded is None or decoded.method != method:
+            cumulative_miles = self.cumulative_miles if self.distance_method == method else None
+            decoded = RouteGeometry.from_polyline(self.geometry, method=method, cumulative_miles=cumulative_miles)
+            self._decoded = decoded
+        return decoded
+
+    @property
+    def is_stale(self):
+        """Whether the route is past its soft TTL and should be refreshed."""
+        return self.fresh_until <= time.time()
+
+    @property
+    def nbytes(self):
+        """Approximate memory held by the route, including its decoded geometry."""
+        size = len(self.geometry)
+        if self.cumulative_miles is not None:
+            size += self.cumulative_miles.nbytes
+        if self._decoded is not None:
+            size += self._decoded.lats.nbytes * 3
+        return size
+
+    def to_bytes(self):
+        """Serialize into a compressed, versioned blob."""
+        geometry = self.geometry.encode('ascii')
+        payload = geometry
+        if self.cumulative_miles is not None:
+            payload += np.ascontiguousarray(self.cumulative_miles, dtype='<f8').tobytes()
+        header = ROUTE_HEADER.pack(
+            ROUTE_MAGIC, ROUTE_SCHEMA_VERSION, DISTANCE_METHOD_CODES[self.distance_method],
+            self.distance, self.duration, self.fresh_until, self.expires_at, len(geometry),
+        )
+        return header + zlib.compress(payload, 6)
+
+    @classmethod
+    def from_bytes(cls, blob):
+        """
+        Deserialize a blob written by `to_bytes`.
+
+        :return: CachedRoute, or None if the blob is not a route of the current schema
+                 (e.g. an entry cached by an older version), which callers treat as a miss.
+        """
+        if not isinstance(blob, bytes) or len(blob) < ROUTE_HEADER.size:
+            return None
+        (magic, version, method_code, distance, duration,
+         fresh_until, expires_at, geometry_size) = ROUTE_HEADER.unpack_from(blob)
+        if magic != ROUTE_MAGIC or version != ROUTE_SCHEMA_VERSION:
+            return None
+        payload = zlib.decompress(blob[ROUTE_HEADER.size:])
+        cumulative_miles = None
+        if len(payload) > geometry_size:
+            cumulative_miles = np.frombuffer(payload, dtype='<f8', offset=geometry_size)
+        return cls(
+            payload[:geometry_size].decode('ascii'), distance, duration,
+            cumulative_miles, DISTANCE_METHOD_NAMES[method_code], fresh_until, expires_at,
+        )
+
+
+class LRUCache:
+    """
+    Thread-safe in-process LRU cache bounded by entry count and total bytes.
+    Every entry carries its own expiry time.
+    """
+
+    def __init__(self, name, max_entries, max_bytes):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, size, expires_at = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                metrics.increment(f'{self.name}.expired')
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, size, expires_at):
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            self.entries[key] = (value, size, expires_at)
+            self.bytes += size
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                metrics.increment(f'{self.name}.evictions')
+            self._record_size()
+
+    def delete(self, key):
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+                self._record_size()
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self._record_size()
+
+    def _remove(self, key):
+        _, size, _ = self.entries.pop(key)
+        self.bytes -= size
+
+    def _record_size(self):
+        metrics.set_gauge(f'{self.name}.entries', len(self.entries))
+        metrics.set_gauge(f'{self.name}.bytes', self.bytes)
+
+
+class TieredRouteCache:
+    """
+    Two-tier cache of routes: a per-process LRU of already-decoded CachedRoute
+    objects in front of the shared Django cache holding compact blobs.
+
+    Local entries never outlive the shared entry they were read from, and are
+    also capped at `local_ttl` seconds. A stale local entry is checked against
+    the shared tier, so a route refreshed by another process replaces it.
+
+    Keys in both tiers carry a generation number kept in the shared cache.
+    `invalidate_all` bumps it, so every entry cached before is unreachable and
+    left to expire; other processes pick up the new generation (and drop their
+    local tier) within `generation_check_interval` seconds. If the generation
+    is evicted from the shared cache, a new one is started, which invalidates
+    every route as well.
+    """
+    GENERATION_KEY = 'route_cache:generation'
+
+    def __init__(self, max_entries, max_bytes, local_ttl, generation_check_interval=5,
+                 distance_method=None):
+        """
+        :param distance_method: Routes put in the local tier are decoded with this
+                                method up front, so local hits are ready to use.
+        """
+        self.local = LRUCache('route_cache.local', max_entries, max_bytes)
+        self.local_ttl = local_ttl
+        self.generation_check_interval = generation_check_interval
+        self.distance_method = distance_method
+        self._generation = None
+        self._generation_checked = 0.0
+
+    @property
+    def generation(self):
+        """The cache generation, read from the shared cache at most every `generation_check_interval`."""
+        now = time.monotonic()
+        if self._generation is not None and now - self._generation_checked < self.generation_check_interval:
+            return self._generation
+        self._generation_checked = now
+        generation = cache.get(self.GENERATION_KEY)
+        if generation is None:
+            generation = self._start_generation()
+        if self._generation is not None and generation != self._generation:
+            self.local.clear()
+        self._generation = generation
+        return generation
+
+    def _key(self, key):
+        return f'{key}:g{self.generation}'
+
+    def _store_local(self, key, route):
+        if self.distance_method:
+            route.to_geometry(self.distance_method)
+        expires_at = min(route.expires_at, time.time() + self.local_ttl)
+        self.local.set(key, route, route.nbytes, expires_at)
+
+    def get(self, key):
+        """
+        :return: CachedRoute, or None if neither tier has the key.
+        """
+        key = self._key(key)
+        local_route = self.local.get(key)
+        if local_route is not None and not local_route.is_stale:
+            metrics.increment('route_cache.local.hits')
+            return local_route
+        metrics.increment('route_cache.local.misses')
+
+        route = CachedRoute.from_bytes(cache.get(key))
+        if route is None or (local_route is not None and route.fresh_until <= local_route.fresh_until):
+            if local_route is not None:
+                metrics.increment('route_cache.local.hits')
+                return local_route
+            metrics.increment('route_cache.shared.misses')
+            return None
+        metrics.increment('route_cache.shared.hits')
+        self._store_local(key, route)
+        return route
+
+    def set(self, key, route, timeout, soft_timeout=None):
+        """
+        Store a route in both tiers for `timeout` seconds.
+
+        :param soft_timeout: Seconds after which the route is stale (see
+                             `CachedRoute.is_stale`); defaults to `timeout`.
+        """
+        key = self._key(key)
+        now = time.time()
+        route.fresh_until = now + min(soft_timeout or timeout, timeout)
+        route.expires_at = now + timeout
+        cache.set(key, route.to_bytes(), timeout=timeout)
+        self._store_local(key, route)
+
+    def invalidate_all(self):
+        """
+        Make every cached route unreachable, in this process at once and in
+        the others within `generation_check_interval` seconds.
+
+        :return: The new generation.
+        """
+        try:
+            generation = cache.incr(self.GENERATION_KEY)
+        except ValueError:
+            generation = self._start_generation()
+        self.local.clear()
+        self._generation = generation
+        self._generation_checked = time.monotonic()
+        return generation
+
+    def _start_generation(self):
+        """
+        Store a new generation when there is none in the shared cache, on first
+        use or after it was evicted. It is the current time in milliseconds (and
+        above the last generation this process saw), so it is greater than any
+        generation used before, and routes of an evicted generation stay unreachable.
+
+        :return: The generation in the shared cache.
+        """
+        generation = max(int(time.time() * 1000), (self._generation or 0) + 1)
+        if not cache.add(self.GENERATION_KEY, generation, timeout=None):
+            # Another process stored one first
+            generation = cache.get(self.GENERATION_KEY, generation)
+        return generation
@@ -0,0 +1,45 @@
+import gzip
+from functools import lru_cache
+from pathlib import Path
+
+import orjson
+
+# Recorded OpenRouteService directions responses, one gzipped JSON file per route:
+# directions_response1 (San Francisco -> Los Angeles) and directions_response2 (Chicago -> Seattle).
+# Used by tests, benchmarks and the offline routing backend; nothing is read until a route is loaded.
+FIXTURES_DIR = Path(__file__).resolve().parent
+SUFFIX = '.json.gz'
+
+
+def available():
+    """
+    :return: Sorted names of the recorded directions responses.
+    """
+    return sorted(path.name[:-len(SUFFIX)] for path in FIXTURES_DIR.glob(f'*{SUFFIX}'))
+
+
+@lru_cache(maxsize=None)
+def load(name):
+    """
+    Load a recorded directions response.
+
+    The response is parsed once per process and shared by every caller, so it
+    must not be modified.
+
+    :param name: Fixture name (see `available`).
+    :return: Directions response dict.
+    :raises KeyError: If there is no recorded response with this name.
+    """
+    path = FIXTURES_DIR / f'{name}{SUFFIX}'
+    if not path.is_file():
+        raise KeyError(name)
+    return orjson.loads(gzip.decompress(path.read_bytes()))
+
+
+def record(name, response):
+    """
+    Save a directions response (e.g. from OpenRouteService) as a new fixture.
+    """
+    data = gzip.compress(orjson.dumps(response), compresslevel=9, mtime=0)
+    (FIXTURES_DIR / f'{name}{SUFFIX}').write_bytes(data)
+    load.cache_clear()
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import polyline
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from . import route_fixtures
+from .geometry import METERS_PER_MILE, haversine_miles
+from .http_client import PooledHttpClient, UpstreamRejected
+
+
+class RoutingBackend:
+    """
+    Base class for routing backends.
+
+    Subclasses implement `directions` (and may implement `async_directions`
+    natively), returning a response in the format of
+    the OpenRouteService JSON directions API (a dict whose 'routes' hold the
+    encoded 'geometry' and a 'summary'), None if there is no route between the
+    points, or raising on a transport error.
+    """
+    name = None
+
+    def directions(self, start, end):
+        """
+        :param start: [longitude, latitude] of the start.
+        :param end: [longitude, latitude] of the destination.
+        :return: Directions response dict.
+        """
+        raise NotImplementedError
+
+    async def async_directions(self, start, end):
+        """
+        Asyncio version of `directions`; by default `directions` runs in a thread.
+        """
+        return await sync_to_async(self.directions, thread_sensitive=False)(start, end)
+
+
+class OpenRouteServiceBackend(RoutingBackend):
+    """
+    Directions from the OpenRouteService HTTP API, or from any server speaking
+    its protocol at `base_url` (such as the routing stub).
+
+    The backend lives for the whole worker process, so its pooled client keeps
+    connections to ORS alive between requests. Remaining keyword arguments
+    (timeouts, retries, circuit breaker) are passed to PooledHttpClient.
+    """
+    name = 'openrouteservice'
+
+    def __init__(self, api_key=None, base_url='https://api.openrouteservice.org', profile='driving-car',
+                 **client_options):
+        self.profile = profile
+        headers = {'Accept': 'application/json, application/geo+json; charset=utf-8'}
+        if api_key:
+            headers['Authorization'] = api_key
+        self.client = PooledHttpClient('routing.http', base_url, headers=headers, **client_options)
+
+    def directions(self, start, end):
+        # Directions requests are read-only, so the client may safely retry them
+        try:
+            return self.client.post_json(self._path(), {'coordinates': [list(start), list(end)]})
+        except UpstreamRejected as exc:
+            # ORS answers 404 when no route connects the points
+            if exc.status_code == 404:
+                return None
+            raise
+
+    async def async_directions(self, start, end):
+        try:
+            return await self.client.apost_json(self._path(), {'coordinates': [list(start), list(end)]})
+        except UpstreamRejected as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+
+    def _path(self):
+        return f'/v2/directions/{self.profile}/json'
+
+
+class OfflineBackend(RoutingBackend):
+    """
+    Deterministic directions without network access, for development, load
+    tests and benchmarks.
+
+    Requests whose endpoints are within `match_tolerance_m` of a recorded
+    response are answered with it. Any other request gets a synthesized
+    great-circle route with a point every `step_miles` and a duration at
+    `speed_mph`.
+    """
+    name = 'offline'
+
+    def __init__(self, recorded=('directions_response1', 'directions_response2'), match_tolerance_m=2000,
+                 step_miles=1.0, speed_mph=55.0, latency=0.0):
+        """
+        :param recorded: Names of recorded responses in `api.route_fixtures` to serve.
+        :param latency: Seconds each call sleeps, to simulate a remote provider.
+        """
+        self.recorded = [route_fixtures.load(name) for name in recorded]
+        self.match_tolerance_m = match_tolerance_m
+        self.step_miles = step_miles
+        self.speed_mph = speed_mph
+        self.latency = latency
+
+    def directions(self, start, end):
+        if self.latency:
+            time.sleep(self.latency)
+        response = self._find_recorded(start, end)
+        if response is not None:
+            return response
+        return self.synthesize(start, end)
+
+    async def async_directions(self, start, end):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        response = self._find_recorded(start, end)
+        if response is not None:
+            return response
+        return self.synthesize(start, end)
+
+    def _find_recorded(self, start, end):
+        for response in self.recorded:
+            recorded_start, recorded_end = response['metadata']['query']['coordinates'][:2]
+            distances = [
+                float(haversine_miles(a[1], a[0], b[1], b[0])) * METERS_PER_MILE
+                for a, b in ((start, recorded_start), (end, recorded_end))
+            ]
+            if max(distances) <= self.match_tolerance_m:
+                return response
+        return None
+
+    def synthesize(self, start, end):
+        """
+        Build a directions response following the great circle from `start` to `end`.
+        """
+        lat1, lon1, lat2, lon2 = (math.radians(value) for value in (start[1], start[0], end[1], end[0]))
+        miles = float(haversine_miles(start[1], start[0], end[1], end[0]))
+        steps = max(1, math.ceil(miles / self.step_miles))
+
+        # Spherical linear interpolation between the endpoint unit vectors
+        a = np.array([math.cos(lat1) * math.cos(lon1), math.cos(lat1) * math.sin(lon1), math.sin(lat1)])
+        b = np.array([math.cos(lat2) * math.cos(lon2), math.cos(lat2) * math.sin(lon2), math.sin(lat2)])
+        angle = math.acos(min(1.0, max(-1.0, float(a @ b))))
+        t = np.linspace(0.0, 1.0, steps + 1)[:, None]
+        if angle < 1e-12:
+            vectors = a + t * (b - a)
+        else:
+            vectors = (np.sin((1 - t) * angle) * a + np.sin(t * angle) * b) / math.sin(angle)
+        lats = np.degrees(np.arctan2(vectors[:, 2], np.hypot(vectors[:, 0], vectors[:, 1])))
+        lons = np.degrees(np.arctan2(vectors[:, 1], vectors[:, 0]))
+
+        distance = miles * METERS_PER_MILE
+        duration = miles / self.speed_mph * 3600
+        return {
+            'bbox': [float(lons.min()), float(lats.min()), float(lons.max()), float(lats.max())],
+            'routes': [{
+                'summary': {'distance': round(distance, 1), 'duration': round(duration, 1)},
+                'geometry': polyline.encode(list(zip(lats.tolist(), lons.tolist()))),
+                'way_points': [0, steps],
+            }],
+            'metadata': {
+                'service': 'routing',
+                'query': {'coordinates': [list(start), list(end)], 'profile': 'driving-car', 'format': 'json'},
+                'engine': {'version': self.name},
+            },
+        }
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (OpenRouteServiceBackend, OfflineBackend)
+}
+
+
+def build_backend(options):
+    """
+    Instantiate a routing backend from settings.
+
+    :param options: Dict with a 'backend' key (see BACKENDS) plus constructor options.
+    :return: RoutingBackend.
+    """
+    options = dict(options)
+    return BACKENDS[options.pop('backend')](**options)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_routing_backend():
+    """
+    This worker's routing backend, the ROUTING_BACKENDS entry named by ROUTING_BACKEND.
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = build_backend(settings.ROUTING_BACKENDS[settings.ROUTING_BACKEND])
+        return _backend
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    # Keep connections alive, as ORS does, so clients can pool them
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        parts = self.path.strip('/').split('/')
+        if len(parts) < 3 or parts[:2] != ['v2', 'directions']:
+            self.send_error(404)
+            return
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+            start, end = body['coordinates'][0], body['coordinates'][-1]
+        except (ValueError, KeyError, IndexError, TypeError):
+            self.send_error(400)
+            return
+        payload = json.dumps(self.server.backend.directions(start, end)).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class RoutingStubServer(ThreadingHTTPServer):
+    """
+    Local HTTP server answering OpenRouteService directions requests
+    (POST /v2/directions/<profile>/json) from an offline backend, so the
+    'openrouteservice' backend can be exercised end to end without network
+    access or an API key.
+    """
+    daemon_threads = True
+    # Load tests open many connections at once
+    request_queue_size = 128
+
+    def __init__(self, address, backend=None, verbose=False):
+        super().__init__(address, _StubRequestHandler)
+        self.backend = backend or OfflineBackend()
+        self.verbose = verbose
@@ -1,7 +1,63 @@
 import reverse_geocode
+from django.conf import settings
 from rest_framework import serializers
+from api.services import RESPONSE_FIELDS
+
+# How the route geometry is returned: (lat, lon) pairs, an encoded polyline, or not at all
+GEOMETRY_FORMATS = ('coordinates', 'polyline', 'none')
+# Request fields shaping the response, passed on to get_route_response
+RESPONSE_OPTIONS = ('geometry', 'simplify', 'fields')
+
+
+def is_within_us(lat, lon):
+    """
+    Use reverse geocoding to check if the location is in the U.S.
+    Returns True if the location is in the U.S., False otherwise.
+    """
+    location = reverse_geocode.get((lon, lat))
+    if location and location["country"] == "United States":
+        return True
+    return False
+
+
+class VehicleSerializer(serializers.Serializer):
+    """
+    Vehicle fields shared by the route, batch and matrix requests.
+    """
+    tank_size = serializers.FloatField(default=50, min_value=1)  # gallons
+    mpg = serializers.FloatField(default=10, min_value=1)
+    start_fuel = serializers.FloatField(required=False, min_value=0)  # gallons, defaults to a full tank
+
+    def validate(self, data):
+        """
+        Ensure the starting fuel fits in the tank.
+        """
+        if data.get('start_fuel', 0) > data['tank_size']:
+            raise serializers.ValidationError({"start_fuel": "Starting fuel exceeds the tank size."})
+        return data
+
+
+class RouteOptionsSerializer(VehicleSerializer):
+    """
+    Vehicle fields and the response options (see RESPONSE_OPTIONS) of route
+    and batch requests.
+    """
+    geometry = serializers.ChoiceField(choices=GEOMETRY_FORMATS, default='coordinates')
+    simplify = serializers.FloatField(required=False, min_value=0)  # tolerance in degrees
+    fields = serializers.MultipleChoiceField(choices=RESPONSE_FIELDS, required=False)
+
+
+class RouteRequestSerializer(RouteOptionsSerializer):
+    """
+    Route request. The U.S. boundary checks of `start` and `end` can be
+    deferred with a `check_boundaries=False` context, then run separately
+    with `boundary_errors` (e.g. while the route is already being fetched).
+    """
+    BOUNDARY_ERRORS = {
+        'start': "Start location is outside U.S. territory.",
+        'end': "End location is outside U.S. territory.",
+    }
 
-class RouteRequestSerializer(serializers.Serializer):
     start = serializers.ListField(child=serializers.FloatField(), min_length=2, max_length=2)
     end = serializers.ListField(child=serializers.FloatField(), min_length=2, max_length=2)
 
@@ -10,8 +66,8 @@ class RouteRequestSerializer(serializers.Serializer):
         Ensure the start location is within the U.S. boundaries.
         """
         lat, lon = value
-        if not self._is_within_us(lat, lon):
-            raise serializers.ValidationError("Start location is outside U.S. territory.")
+        if self.context.get('check_boundaries', True) and not is_within_us(lat, lon):
+            raise serializers.ValidationError(self.BOUNDARY_ERRORS['start'])
         return value
 
     def validate_end(self, value):
@@ -19,16 +75,70 @@ class RouteRequestSerializer(serializers.Serializer):
         Ensure the end location is within the U.S. boundaries.
         """
         lat, lon = value
-        if not self._is_within_us(lat, lon):
-            raise serializers.ValidationError("End location is outside U.S. territory.")
+        if self.context.get('check_boundaries', True) and not is_within_us(lat, lon):
+            raise serializers.ValidationError(self.BOUNDARY_ERRORS['end'])
         return value
 
-    def _is_within_us(self, lat, lon):
+    def boundary_errors(self):
+        """
+        Run the U.S. boundary checks on validated data.
+
+        :return: Dict of field -> list of errors, empty if both locations are in the U.S.
+        """
+        return {
+            field: [message]
+            for field, message in self.BOUNDARY_ERRORS.items()
+            if not is_within_us(*self.validated_data[field])
+        }
+
+
+class BatchRouteRequestSerializer(RouteOptionsSerializer):
+    """
+    Many lanes planned in one call. Each lane is a dict with 'start', 'end', an
+    optional 'id' echoed back with its result, and optionally its own vehicle
+    fields; lanes are validated one by one, so one bad lane fails only itself.
+    """
+    lanes = serializers.ListField(
+        child=serializers.DictField(), min_length=1, max_length=settings.ROUTE_BATCH_MAX_LANES,
+    )
+
+
+class MatrixRouteRequestSerializer(VehicleSerializer):
+    """
+    Fuel cost matrix from every origin to every destination.
+    """
+    origins = serializers.ListField(
+        child=serializers.ListField(child=serializers.FloatField(), min_length=2, max_length=2), min_length=1,
+    )
+    destinations = serializers.ListField(
+        child=serializers.ListField(child=serializers.FloatField(), min_length=2, max_length=2), min_length=1,
+    )
+    include_geometry = serializers.BooleanField(default=False)
+
+    def validate_origins(self, value):
+        return self._validate_points(value, "Origin")
+
+    def validate_destinations(self, value):
+        return self._validate_points(value, "Destination")
+
+    def validate(self, data):
+        """
+        Ensure the matrix is not too large and the starting fuel fits in the tank.
+        """
+        cells = len(data['origins']) * len(data['destinations'])
+        if cells > settings.ROUTE_MATRIX_MAX_CELLS:
+            raise serializers.ValidationError(
+                f"The matrix has {cells} cells, more than the {settings.ROUTE_MATRIX_MAX_CELLS} allowed."
+            )
+        return super().validate(data)
+
+    def _validate_points(self, points, label):
         """
-        Use reverse geocoding to check if the location is in the U.S.
-        Returns True if the location is in the U.S., False otherwise.
+        Ensure every location is within the U.S. boundaries.
         """
-        location = reverse_geocode.get((lon, lat))
-        if location and location["country"] == "United States":
-            return True
-        return False
+        outside = [index for index, (lat, lon) in enumerate(points) if not is_within_us(lat, lon)]
+        if outside:
+            raise serializers.ValidationError(
+                f"{label} locations {outside} are outside U.S. territory."
+            )
+        return points
@@ -1,175 +1,428 @@
-import openrouteservice
-import polyline
-import pandas as pd
+import asyncio
+import hashlib
+import json
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.core.cache import cache
-from django.contrib.gis.measure import D
-from django.contrib.gis.geos import Point
-from geopy.distance import geodesic
-from .utils import directions_response2, generate_cache_key
-from .models import FuelPrice
+from . import metrics
+from .route_cache import CachedRoute, TieredRouteCache
+from .planner import plan_refuelling
+from .quantize import normalize_endpoints
+from .routing import get_routing_backend
+from .singleflight import BackgroundRefresher, SingleFlight
+from .station_index import current_dataset_version, get_station_index
+from .stations import find_corridor_stations
+from .utils import generate_cache_key
+
+route_cache = TieredRouteCache(
+    max_entries=settings.ROUTE_CACHE_LOCAL_MAX_ENTRIES,
+    max_bytes=settings.ROUTE_CACHE_LOCAL_MAX_BYTES,
+    local_ttl=settings.ROUTE_CACHE_LOCAL_TTL,
+    distance_method=settings.ROUTE_DISTANCE_METHOD,
+)
+
+# Concurrent cache misses for the same route share a single ORS call
+directions_flight = SingleFlight(
+    'directions',
+    lock_timeout=settings.DIRECTIONS_SINGLEFLIGHT_TIMEOUT,
+    wait_timeout=settings.DIRECTIONS_SINGLEFLIGHT_TIMEOUT,
+)
+
+# Stale routes are served while one background call refreshes them
+directions_refresher = BackgroundRefresher(
+    'directions.refresh',
+    workers=settings.DIRECTIONS_REFRESH_WORKERS,
+    lock_timeout=settings.DIRECTIONS_SINGLEFLIGHT_TIMEOUT,
+)
 
+# Fields of a route response, in response order; callers may ask for a subset
+RESPONSE_FIELDS = ('route', 'fuel_stops', 'total_fuel_cost', 'map_url')
 
-def get_directions(start, end):
+# A planned fuel stop as reported to clients: the station, its position along the
+# route, and the fuel bought there
+FuelStop = namedtuple(
+    'FuelStop', ['mile_position', 'name', 'price', 'location', 'off_route_miles', 'gallons', 'cost'],
+)
+
+# Threads running the CPU-bound steps (decoding, distances, planning) of async requests
+cpu_executor = ThreadPoolExecutor(max_workers=settings.ROUTE_CPU_WORKERS, thread_name_prefix='route-cpu')
+
+
+def get_directions(start, end, normalized=False):
     """
-    Fetch driving directions between two locations using the OpenRouteService API.
+    Fetch driving directions between two locations using the configured routing backend (ROUTING_BACKEND).
 
     :param start: Tuple (latitude, longitude) representing the starting location.
     :param end: Tuple (latitude, longitude) representing the destination.
-    :return: JSON response containing route details.
+    :param normalized: The endpoints already went through `normalize_endpoints`.
+    :return: CachedRoute with the route geometry and summary, or None if there is no route.
+    """
+    start, end, cache_key, cached_route = _lookup_directions(start, end, normalized)
+    if cached_route:
+        return cached_route
+
+    return directions_flight.do(
+        cache_key,
+        lambda: _fetch_directions(start, end, cache_key),
+        lambda: route_cache.get(cache_key),
+    )
+
+async def aget_directions(start, end, normalized=False):
+    """
+    Asyncio version of `get_directions`, calling the routing backend asynchronously.
+    """
+    start, end, cache_key, cached_route = await sync_to_async(_lookup_directions, thread_sensitive=False)(
+        start, end, normalized,
+    )
+    if cached_route:
+        return cached_route
+
+    async def fetch():
+        directions = await get_routing_backend().async_directions(start, end)
+        return await sync_to_async(_store_directions, thread_sensitive=False)(directions, cache_key)
+
+    return await directions_flight.ado(
+        cache_key, fetch, lambda: sync_to_async(route_cache.get, thread_sensitive=False)(cache_key),
+    )
+
+def _lookup_directions(start, end, normalized=False):
     """
+    Normalize the endpoints (unless already `normalized`) and look their route up in the cache.
+
+    :return: Tuple (start, end, cache key, CachedRoute or None).
+    """
+    # Nearly identical endpoints are routed (and cached) as the same request
+    if not normalized:
+        start, end = normalize_endpoints(start, end)
     cache_key = generate_cache_key(start, end)
-    cached_data = cache.get(cache_key)
-    if cached_data:
-        return cached_data
+    cached_route = route_cache.get(cache_key)
+    if cached_route and cached_route.is_stale:
+        # Past the soft TTL the route is still served, and refreshed in the background;
+        # callers only wait for ORS once the entry has expired from the cache
+        metrics.increment('directions.stale_served')
+        directions_refresher.schedule(cache_key, lambda: _fetch_directions(start, end, cache_key))
+    return start, end, cache_key, cached_route
+
+def _fetch_directions(start, end, cache_key):
+    """
+    Call the configured routing backend and cache the compact route under `cache_key`.
+    """
+    # Set ROUTING_BACKEND to 'offline' to route without the OpenRouteService API
+    directions = get_routing_backend().directions(start, end)
+    return _store_directions(directions, cache_key)
 
-    client = openrouteservice.Client(key=settings.ORS_API_KEY)
-    directions = client.directions(coordinates=[start, end], profile='driving-car')
-    # directions = directions_response2
+def _store_directions(directions, cache_key):
+    """
+    Cache the compact route of a directions response under `cache_key`.
+
+    :return: CachedRoute, or None if the response has no route.
+    """
+    # Only the geometry and summary are cached, with cumulative miles precomputed
+    route = CachedRoute.from_directions(
+        directions,
+        distance_method=settings.ROUTE_DISTANCE_METHOD if settings.DIRECTIONS_CACHE_CUMULATIVE_MILES else None,
+    )
+    if route is None:
+        return None
     '''
-    Caching is set to 1 hour (3600 seconds) to reduce API calls and improve response times.
-    However, since route data can change due to traffic or road closures, a shorter cache 
-    duration (e.g., 10-15 minutes) might be more suitable in dynamic environments. 
-    Adjust the timeout based on how frequently route data is expected to change.
+    Routes are fresh for 10 minutes (DIRECTIONS_CACHE_SOFT_TIMEOUT), since route data can change
+    due to traffic or road closures, but are kept for 1 hour (DIRECTIONS_CACHE_TIMEOUT). In between,
+    the stale route is served while it is refreshed in the background, so API calls stay off the
+    request path. Adjust both based on how frequently route data is expected to change.
     '''
-    cache.set(cache_key, directions, timeout=3600)  # Cache for 1 hour
-    return directions
+    route_cache.set(
+        cache_key, route,
+        timeout=settings.DIRECTIONS_CACHE_TIMEOUT,
+        soft_timeout=settings.DIRECTIONS_CACHE_SOFT_TIMEOUT,
+    )
+    return route
 
-def get_route_with_stops(start, end):
+def plan_route_stops(route, tank_size=50, mpg=10, start_fuel=None, station_index=None):
     """
-    Retrieve a route with fuel stops based on the cheapest fuel prices along the way,  
-            **** assuming the car is fully fueled at the beginning. ****
+    Decode a route and plan the cheapest fuel stops along it.
 
-    :param start: Tuple (latitude, longitude) representing the starting location.
-    :param end: Tuple (latitude, longitude) representing the destination.
+    :param route: CachedRoute, or None if no route was found.
+    :param tank_size: Tank capacity in gallons.
+    :param mpg: Fuel economy in miles per gallon.
+    :param start_fuel: Fuel in the tank at the start in gallons (default: full tank).
+    :param station_index: StationIndex to plan from (default: this worker's current index),
+                          so that every route of a batch uses the same one.
     :return: Tuple containing:
-             - decoded_route: List of (latitude, longitude) tuples representing the route.
-             - stops_df: Pandas DataFrame with details of the cheapest fuel stops along the route.
+             - geometry: RouteGeometry of the decoded route with its cumulative distances.
+             - stops: List of FuelStop, the planned fuel stops and quantities bought.
+    :raises RefuelPlanError: If the route has a stretch without stations longer than the range.
     """
-    directions = get_directions(start, end)
-    if not directions or 'routes' not in directions:
-        return None, pd.DataFrame()
+    if route is None:
+        return None, []
 
-    route = directions['routes'][0]
-    decoded_route = polyline.decode(route['geometry'])
-    
-    # Calculate cumulative distances for route points
-    cumulative_distances = [0.0]
-    for i in range(1, len(decoded_route)):
-        cumulative_distances.append(
-            cumulative_distances[-1] + 
-            geodesic(decoded_route[i-1], decoded_route[i]).miles
+    geometry = route.to_geometry(settings.ROUTE_DISTANCE_METHOD)
+    # One corridor query for the whole route; stops are then planned in memory
+    if settings.FUEL_STATION_SOURCE == 'index':
+        if station_index is None:
+            station_index = get_station_index()
+        candidates = station_index.corridor(geometry, settings.FUEL_CORRIDOR_RADIUS_MILES)
+    else:
+        candidates = find_corridor_stations(geometry, settings.FUEL_CORRIDOR_RADIUS_MILES)
+    plan = plan_refuelling(
+        candidates, geometry.total_miles,
+        tank_size=tank_size, mpg=mpg, start_fuel=start_fuel,
+    )
+
+    stops = [
+        FuelStop(
+            mile_position=float(refuel.station.mile),
+            name=refuel.station.name,
+            price=float(refuel.station.price),
+            location=[float(refuel.station.lat), float(refuel.station.lon)],
+            off_route_miles=float(refuel.station.off_route_miles),
+            gallons=round(refuel.gallons, 2),
+            cost=round(refuel.cost, 2),
         )
+        for refuel in plan
+    ]
+    return geometry, stops
 
-    # Split route into 400-mile segments (conservative for 500-mile range)
-    segments = []
-    current_segment = 0
-    while current_segment < cumulative_distances[-1]:
-        # Find midpoint of current segment
-        end_segment = current_segment + 400
-        if end_segment > cumulative_distances[-1]:
-            break
-        idx = next(i for i, d in enumerate(cumulative_distances) if d >= end_segment)
-        midpoint = decoded_route[idx//2]
-        segments.append({
-            'start_mile': current_segment,
-            'end_mile': end_segment,
-            'midpoint': Point(midpoint[1], midpoint[0]),  # (lon, lat)
-        })
-        current_segment = end_segment
-
-    # Find cheapest station near each segment's midpoint
-    stops = []
-    for segment in segments:
-        # Find cheapest station within 50 miles of midpoint
-        cheapest = FuelPrice.objects.filter(
-            location__dwithin=(segment['midpoint'], D(mi=50))
-        ).order_by('retail_price').first()
-        
-        if cheapest:
-            stops.append({
-                'mile_position': segment['start_mile'],
-                'name': cheapest.truckstop_name,
-                'price': cheapest.retail_price,
-                'location': [cheapest.location.y, cheapest.location.x]
-            })
-
-    return decoded_route, pd.DataFrame(stops)
-
-def calculate_fuel_cost(route_distance, stops):
-    """
-    Calculate the estimated fuel cost for a given route based on fuel prices at stops.
-
-    :param route_distance: Total route distance in miles.
-    :param stops: List of dictionaries containing fuel stop details, including 'retail_price'.
-    :return: Estimated fuel cost in dollars.
+def _plan_route_response(route, tank_size, mpg, start_fuel, station_index=None):
     """
-    if not stops:
-        return 0
+    Plan a route's fuel stops, cost and map URL: the CPU-bound part of
+    `get_route_plan`, from the CachedRoute on.
 
-    # Split route into segments between stops
-    segments = []
-    prev_stop = 0
+    :return: The response without its "route" geometry, or None if there is no route.
+             It also holds the route's "distance" (meters) and "duration" (seconds),
+             which `shape_route_response` leaves out of the response.
+    """
+    geometry, stops = plan_route_stops(
+        route, tank_size=tank_size, mpg=mpg, start_fuel=start_fuel, station_index=station_index,
+    )
+    if geometry is None:
+        return None
 
-    for stop in stops:
-        segments.append(min(500, stop['mile_position'] - prev_stop))
-        prev_stop = stop['mile_position']
-    
-    # Add final segment if needed
-    final_segment = route_distance - prev_stop
-    if final_segment > 0:
-        segments.append(final_segment)
+    # Prepare stops data
+    stop_data = [stop._asdict() for stop in stops]
 
-    # Calculate cost using cheapest available price for each segment
-    total_cost = 0
-    price_idx = 0
-    for seg_length in segments:
-        if price_idx < len(stops):
-            price = stops[price_idx]['price']
-            price_idx += 1
-        else:  # Use last known price if no more stops
-            price = stops[-1]['price']
-        
-        total_cost += (seg_length / 10) * price
+    return {
+        "fuel_stops": stop_data,
+        "total_fuel_cost": calculate_fuel_cost(stop_data),
+        "map_url": generate_google_maps_map_url(geometry, stop_data),
+        "distance": route.distance,
+        "duration": route.duration,
+    }
 
-    return round(total_cost, 2)
+def format_route_geometry(route, geometry='coordinates', simplify=None):
+    """
+    Render a route's geometry for the response.
+
+    :param route: CachedRoute.
+    :param geometry: 'coordinates' for an (n, 2) array of (lat, lon) points, which the
+                     renderer serializes without building Python lists, or 'polyline'
+                     for an encoded polyline string.
+    :param simplify: Simplification tolerance in degrees (e.g. 0.001, about 100 m), or None.
+    """
+    if geometry == 'polyline' and not simplify:
+        # The cached geometry already is the route's encoded polyline
+        return route.geometry
+    points = route.to_geometry(settings.ROUTE_DISTANCE_METHOD).coordinates
+    if simplify:
+        points = simplify_route(points, tolerance=simplify)
+    if geometry == 'polyline':
+        return encode_polyline(points.tolist())
+    return points
+
+def shape_route_response(plan, route, geometry='coordinates', simplify=None, fields=None):
+    """
+    Assemble the response requested by the caller from a planned route.
+
+    :param plan: Response without its geometry, from `_plan_route_response`.
+    :param route: CachedRoute, or a callable returning it; only used if the geometry is requested.
+    :param geometry: 'coordinates', 'polyline' or 'none' (see `format_route_geometry`).
+    :param fields: Response fields to include (default: all of RESPONSE_FIELDS).
+    """
+    fields = RESPONSE_FIELDS if fields is None else set(fields)
+    response = {}
+    if 'route' in fields and geometry != 'none':
+        route = route() if callable(route) else route
+        if route is not None:
+            response['route'] = format_route_geometry(route, geometry, simplify)
+    response.update(
+        (field, plan[field]) for field in RESPONSE_FIELDS[1:] if field in fields and field in plan
+    )
+    return response
+
+def get_route_response(start, end, tank_size=50, mpg=10, start_fuel=None, station_index=None,
+                       geometry='coordinates', simplify=None, fields=None, normalized=False):
+    """
+    Route response for a lane: the plan from `get_route_plan`, shaped by `shape_route_response`.
+
+    Results are cached under the normalized endpoints, the vehicle parameters and
+    the fuel price dataset version, so a repeated lane is a single cache lookup
+    and a price import makes every earlier result unreachable. They expire when
+    the route they were planned on goes stale (see `_route_response_timeout`),
+    and plans of stale routes are not cached. The geometry is
+    not part of the cached result: it comes from the route cache, and only when
+    the caller asks for it.
+
+    :param normalized: The endpoints already went through `normalize_endpoints`.
+    """
+    plan, route = get_route_plan(
+        start, end, tank_size=tank_size, mpg=mpg, start_fuel=start_fuel,
+        station_index=station_index, normalized=normalized,
+    )
+    if plan is None:
+        return None
+    return shape_route_response(plan, route, geometry=geometry, simplify=simplify, fields=fields)
 
+def get_route_plan(start, end, tank_size=50, mpg=10, start_fuel=None, station_index=None, normalized=False):
+    """
+    The memoized part of `get_route_response`: the route's plan, before shaping.
 
-def calculate_route_distance(route):
+    :param normalized: The endpoints already went through `normalize_endpoints`.
+    :return: Tuple (plan, route) with the plan from `_plan_route_response` and its
+             CachedRoute, or a callable returning it when the plan was cached; or
+             (None, None) if there is no route.
     """
-    Calculate the total distance of a route based on decoded coordinates.
+    if not normalized:
+        start, end = normalize_endpoints(start, end)
+    if start_fuel is None:
+        start_fuel = tank_size
+    version = station_index.version if station_index is not None else current_dataset_version()
+    cache_key = _route_response_key(start, end, tank_size, mpg, start_fuel, version)
+
+    plan = cache.get(cache_key)
+    if plan is not None:
+        metrics.increment('route_response_cache.hits')
+        return plan, partial(get_directions, start, end, normalized=True)
 
-    :param route: List of (latitude, longitude) tuples representing the route.
-    :return: Total distance in miles.
+    metrics.increment('route_response_cache.misses')
+    route = get_directions(start, end, normalized=True)
+    plan = _plan_route_response(route, tank_size, mpg, start_fuel, station_index)
+    if plan is None:
+        return None, None
+    timeout = _route_response_timeout(route)
+    if timeout > 0:
+        cache.set(cache_key, plan, timeout=timeout)
+    return plan, route
+
+async def aget_route_response(start, end, tank_size=50, mpg=10, start_fuel=None,
+                              geometry='coordinates', simplify=None, fields=None, normalized=False):
     """
-    total_distance = 0
-    for i in range(len(route) - 1):
-        total_distance += geodesic(route[i], route[i + 1]).miles
-    return total_distance
+    Asyncio version of `get_route_response`.
+
+    The directions are fetched while the station index is loaded (or checked
+    for a new dataset version), and the decoding, distance, planning and
+    geometry steps run on `cpu_executor`, so the event loop is only ever
+    waiting on I/O.
 
-def generate_google_maps_map_url(route):
+    Steps that may query the database (dataset version, station index refresh,
+    PostGIS corridor query) run through thread-sensitive `sync_to_async`
+    instead, in the request's sync thread, where Django closes the connections
+    they open; connections opened on `cpu_executor` would never be closed.
+    """
+    if not normalized:
+        start, end = await sync_to_async(normalize_endpoints, thread_sensitive=False)(start, end)
+    if start_fuel is None:
+        start_fuel = tank_size
+    wants_geometry = geometry != 'none' and (fields is None or 'route' in fields)
+    directions = asyncio.ensure_future(aget_directions(start, end, normalized=True))
+    try:
+        version = await sync_to_async(current_dataset_version)()
+        cache_key = _route_response_key(start, end, tank_size, mpg, start_fuel, version)
+        plan = await sync_to_async(cache.get, thread_sensitive=False)(cache_key)
+        if plan is not None:
+            metrics.increment('route_response_cache.hits')
+            if not wants_geometry:
+                directions.cancel()
+        else:
+            metrics.increment('route_response_cache.misses')
+        route = await directions if plan is None or wants_geometry else None
+    except BaseException:
+        directions.cancel()
+        raise
+
+    loop = asyncio.get_running_loop()
+    if plan is None:
+        if settings.FUEL_STATION_SOURCE == 'index':
+            station_index = await sync_to_async(get_station_index)()
+            plan = await loop.run_in_executor(
+                cpu_executor, _plan_route_response, route, tank_size, mpg, start_fuel, station_index,
+            )
+        else:
+            # Corridor stations come from a PostGIS query
+            plan = await sync_to_async(_plan_route_response)(route, tank_size, mpg, start_fuel)
+        if plan is None:
+            return None
+        timeout = _route_response_timeout(route)
+        if timeout > 0:
+            await sync_to_async(cache.set, thread_sensitive=False)(cache_key, plan, timeout=timeout)
+    return await loop.run_in_executor(
+        cpu_executor, partial(shape_route_response, plan, route, geometry=geometry, simplify=simplify, fields=fields),
+    )
+
+def _route_response_timeout(route):
+    """
+    Seconds to cache a plan of `route`: at most until the route goes stale, so the
+    plan never outlives it. Once the route is refreshed, it is planned again, and
+    a cached plan is never served with the geometry of a newer route.
+
+    :return: Timeout in seconds, 0 or less if the route is already stale.
+    """
+    return min(settings.ROUTE_RESPONSE_CACHE_TIMEOUT, int(route.fresh_until - time.time()))
+
+def _route_response_key(start, end, tank_size, mpg, start_fuel, dataset_version):
+    key_data = json.dumps([start, end, float(tank_size), float(mpg), float(start_fuel)])
+    # Responses are planned from cached routes, so invalidating the routes invalidates them too
+    return (
+        f"route_response:{dataset_version}:{route_cache.generation}:"
+        f"{hashlib.sha1(key_data.encode('utf-8')).hexdigest()}"
+    )
+
+def calculate_fuel_cost(stops):
+    """
+    Calculate the estimated fuel cost of the planned purchases.
+
+    :param stops: List of dictionaries containing fuel stop details, including 'cost'.
+    :return: Estimated fuel cost in dollars.
+    """
+    return round(sum(stop['cost'] for stop in stops), 2)
+
+def generate_google_maps_map_url(route, stops=()):
     """
     Generate a static map URL for large routes by simplifying and polyline encoding.
+
+    :param route: RouteGeometry of the route.
+    :param stops: Fuel stops to mark at their stations' locations.
     """
     base_url = "https://maps.googleapis.com/maps/api/staticmap?"
     
     # Simplify the route to reduce points
-    simplified_route = simplify_route(route, tolerance=0.001, every_n=5)
+    simplified_route = simplify_route(route.points, tolerance=0.001, every_n=5)
     
     # Encode the simplified route
     encoded_polyline = encode_polyline(simplified_route)
     
     # Build URL
     path_param = f"path=enc:{encoded_polyline}"
-    markers = "&".join([f"markers=color:red%7C{lat},{lon}" for lat, lon in [route[0], route[-1]]])
-    return f"{base_url}{path_param}&{markers}&size=600x400&key={settings.GOOGLE_MAPS_API_KEY}"
+    markers = route.markers
+    endpoints = [markers.position_at(0), markers.position_at(route.total_miles)]
+    marker_params = [f"markers=color:red%7C{lat},{lon}" for lat, lon in endpoints]
+    marker_params += [
+        "markers=color:blue%7C{},{}".format(*stop['location'])
+        for stop in stops
+    ]
+    return f"{base_url}{path_param}&{'&'.join(marker_params)}&size=600x400&key={settings.GOOGLE_MAPS_API_KEY}"
 
 def generate_ors_map_url(route):
     """
     Generate an OpenRouteService map URL with an encoded polyline.
     Simplifies the route to stay within browser URL limits.
+
+    :param route: RouteGeometry of the route.
     """
-    simplified_route = simplify_route(route, tolerance=0.001, every_n=5)
+    simplified_route = simplify_route(route.points, tolerance=0.001, every_n=5)
     encoded_polyline = encode_polyline(simplified_route)
     
     return f"https://openrouteservice.org/maps/?p={encoded_polyline}&mode=drive"
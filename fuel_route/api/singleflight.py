@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+
+from . import metrics
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that would compute the same cached value.
+
+    Within a process, the first caller for a key becomes the leader and later
+    callers wait for its result. Across processes, leaders take a lock in the
+    shared cache (`cache.add` with a timeout); a process that finds the lock
+    held polls the lock until it is released, then looks up the result instead
+    of computing it. It computes the value itself only if the result is still
+    missing (the leader failed) or the wait times out.
+
+    Polling only retries the lock, so `lookup` runs once per caller, and
+    waiting does not show up in the lookup's own cache metrics.
+    """
+
+    def __init__(self, name, lock_timeout=30, wait_timeout=30, poll_interval=0.05):
+        """
+        :param name: Prefix for lock keys and metric names.
+        :param lock_timeout: Seconds after which a cross-process lock expires.
+        :param wait_timeout: Seconds a follower waits before computing the value itself.
+        :param poll_interval: Seconds between lock polls while another process leads.
+        """
+        self.name = name
+        self.lock_timeout = lock_timeout
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._async_calls = {}
+
+    def do(self, key, compute, lookup):
+        """
+        Return the value for `key`, computing it at most once across concurrent callers.
+
+        :param key: Cache key identifying the value.
+        :param compute: Callable computing the value (and storing it where `lookup` finds it).
+        :param lookup: Callable returning the stored value, or None if there is none yet.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            metrics.increment(f'{self.name}.coalesced.local')
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_shared(key, compute, lookup)
+            return call.result
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    async def ado(self, key, compute, lookup):
+        """
+        Asyncio version of `do`: `compute` and `lookup` are coroutine functions.
+
+        Coroutines of the event loop asking for the same key await one shared
+        task, which keeps running if the caller that started it is cancelled.
+        The cross-process lock is taken as in `do`.
+        """
+        loop = asyncio.get_running_loop()
+        calls = self._async_calls.setdefault(loop, {})
+        task = calls.get(key)
+        if task is not None:
+            metrics.increment(f'{self.name}.coalesced.local')
+        else:
+            task = calls[key] = loop.create_task(self._ado_shared(key, compute, lookup))
+
+            def forget(_):
+                del calls[key]
+                if not calls:
+                    self._async_calls.pop(loop, None)
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    async def _ado_shared(self, key, compute, lookup):
+        lock_key = f'{self.name}:lock:{key}'
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+        add = sync_to_async(cache.add, thread_sensitive=False)
+        while not await add(lock_key, token, timeout=self.lock_timeout):
+            if time.monotonic() >= deadline:
+                metrics.increment(f'{self.name}.wait_timeout')
+                return await compute()
+            await asyncio.sleep(self.poll_interval)
+
+        try:
+            value = await lookup()
+            if value is not None:
+                metrics.increment(f'{self.name}.coalesced.remote')
+                return value
+            metrics.increment(f'{self.name}.leader')
+            return await compute()
+        finally:
+            await sync_to_async(self._release, thread_sensitive=False)(lock_key, token)
+
+    def _release(self, lock_key, token):
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+    def _do_shared(self, key, compute, lookup):
+        lock_key = f'{self.name}:lock:{key}'
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+        while not cache.add(lock_key, token, timeout=self.lock_timeout):
+            # Another process is computing the value: wait for it to release the lock
+            if time.monotonic() >= deadline:
+                metrics.increment(f'{self.name}.wait_timeout')
+                return compute()
+            time.sleep(self.poll_interval)
+
+        try:
+            # The previous leader may have stored the value before releasing the lock
+            value = lookup()
+            if value is not None:
+                metrics.increment(f'{self.name}.coalesced.remote')
+                return value
+            metrics.increment(f'{self.name}.leader')
+            return compute()
+        finally:
+            self._release(lock_key, token)
+
+
+class BackgroundRefresher:
+    """
+    Runs refreshes of stale cached values in the background, at most one per key.
+
+    Within a process, a key already being refreshed is not scheduled again.
+    Across processes, a refresh first takes a lock in the shared cache
+    (`cache.add` with a timeout) and is skipped if another process holds it.
+    The lock is kept until it expires, so a key is refreshed at most once per
+    `lock_timeout` seconds even if the refreshed value is slow to propagate.
+    """
+
+    def __init__(self, name, workers=2, lock_timeout=30):
+        """
+        :param name: Prefix for lock keys and metric names.
+        :param workers: Threads running refreshes in each process.
+        :param lock_timeout: Seconds after which a cross-process lock expires.
+        """
+        self.name = name
+        self.workers = workers
+        self.lock_timeout = lock_timeout
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def schedule(self, key, refresh):
+        """
+        Run `refresh` in the background unless `key` is already being refreshed.
+
+        :param key: Cache key identifying the value.
+        :param refresh: Callable recomputing the value and storing it in the cache.
+        :return: True if a refresh was scheduled.
+        """
+        with self._lock:
+            if key in self._pending:
+                metrics.increment(f'{self.name}.deduplicated')
+                return False
+            self._pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix=self.name,
+                )
+        self._executor.submit(self._run, key, refresh)
+        return True
+
+    def _run(self, key, refresh):
+        try:
+            if not cache.add(f'{self.name}:lock:{key}', 1, timeout=self.lock_timeout):
+                metrics.increment(f'{self.name}.deduplicated')
+                return
+            metrics.increment(f'{self.name}.started')
+            refresh()
+        except Exception:
+            # The stale value keeps being served until the next attempt or its hard expiry
+            metrics.increment(f'{self.name}.failed')
+        finally:
+            with self._lock:
+                self._pending.discard(key)
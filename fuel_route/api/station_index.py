@@ -0,0 +1,367 @@
+import math
+import mmap
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+from django.conf import settings
+from django.contrib.gis.db.models import GeometryField
+from django.db.models.functions import Cast
+
+from .geometry import EARTH_RADIUS_MILES, haversine_miles
+from .models import DatasetVersion, FuelPrice
+from .stations import PointX, PointY, StationCandidate
+
+MILES_PER_DEGREE = EARTH_RADIUS_MILES * math.pi / 180
+
+# Upper bound on stations x route segments compared at once in corridor queries
+CORRIDOR_CHUNK_SIZE = 2_000_000
+
+# Snapshot file layout: header, then 8-byte aligned arrays (see `write_snapshot`)
+SNAPSHOT_MAGIC = b'FUELSNAP'
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<8sIIQQdddQQ')
+
+
+class StationIndex:
+    """
+    In-memory spatial index over located fuel stations.
+
+    Stations are bucketed into a regular lat/lon grid and stored sorted by cell,
+    with `cell_start` giving each cell's slice (CSR layout), so a query only
+    looks at the stations in the cells it overlaps. Price and id arrays are kept
+    alongside the coordinates, which lets radius, k-nearest and route-corridor
+    queries run without touching the database.
+    """
+
+    def __init__(self, ids, names, prices, lats, lons, version=0, cell_size=0.5):
+        """
+        :param ids: FuelPrice primary keys.
+        :param names: Truck stop names.
+        :param prices: Retail prices.
+        :param lats: Station latitudes (degrees).
+        :param lons: Station longitudes (degrees).
+        :param version: Dataset version the stations were loaded from.
+        :param cell_size: Grid cell size in degrees.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        self.version = version
+        self.cell_size = cell_size
+        if len(lats):
+            self.origin = (math.floor(lats.min()), math.floor(lons.min()))
+            self.n_rows = int((lats.max() - self.origin[0]) // cell_size) + 1
+            self.n_cols = int((lons.max() - self.origin[1]) // cell_size) + 1
+        else:
+            self.origin, self.n_rows, self.n_cols = (0.0, 0.0), 0, 0
+
+        cells = self._cells(lats, lons)
+        order = np.argsort(cells, kind='stable')
+        self.ids = np.asarray(ids, dtype=np.int64)[order]
+        self.prices = np.asarray(prices, dtype=np.float64)[order]
+        self.lats = lats[order]
+        self.lons = lons[order]
+        encoded = [names[i].encode('utf-8') for i in order.tolist()]
+        self.name_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(name) for name in encoded], out=self.name_offsets[1:])
+        self.name_blob = b''.join(encoded)
+        self.cell_start = np.searchsorted(
+            cells[order], np.arange(self.n_rows * self.n_cols + 1)
+        ).astype(np.int64)
+        self.snapshot_key = None
+
+    @classmethod
+    def from_database(cls, **kwargs):
+        """
+        Load every located FuelPrice row into a new index.
+        """
+        version = DatasetVersion.current()
+        point = Cast('location', GeometryField(srid=4326))
+        rows = list(
+            FuelPrice.objects
+            .exclude(location=None)
+            .annotate(lat=PointY(point), lon=PointX(point))
+            .values_list('id', 'truckstop_name', 'retail_price', 'lat', 'lon')
+        )
+        ids, names, prices, lats, lons = zip(*rows) if rows else ((),) * 5
+        return cls(ids, names, prices, lats, lons, version=version, **kwargs)
+
+    @classmethod
+    def from_snapshot(cls, path):
+        """
+        Map a snapshot written by `write_snapshot`.
+
+        The arrays are views straight onto the memory-mapped file, so every
+        worker mapping the same snapshot shares one copy in the page cache.
+        """
+        with open(path, 'rb') as f:
+            snapshot_key = _snapshot_key(f.fileno())
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, format_version, version, count, blob_size, cell_size,
+         origin_lat, origin_lon, n_rows, n_cols) = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+        if magic != SNAPSHOT_MAGIC or format_version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {SNAPSHOT_FORMAT_VERSION} station snapshot")
+
+        index = cls.__new__(cls)
+        index.version = version
+        index.cell_size = cell_size
+        index.origin = (origin_lat, origin_lon)
+        index.n_rows, index.n_cols = n_rows, n_cols
+        offset = SNAPSHOT_HEADER.size
+        for name, dtype, length in (
+            ('ids', np.int64, count),
+            ('prices', np.float64, count),
+            ('lats', np.float64, count),
+            ('lons', np.float64, count),
+            ('name_offsets', np.int64, count + 1),
+            ('cell_start', np.int64, n_rows * n_cols + 1),
+        ):
+            setattr(index, name, np.frombuffer(buffer, dtype=dtype, count=length, offset=offset))
+            offset += length * 8
+        index.name_blob = memoryview(buffer)[offset:offset + blob_size]
+        index.snapshot_key = snapshot_key
+        return index
+
+    def write_snapshot(self, path):
+        """
+        Write the index to a snapshot file for `from_snapshot`.
+
+        The file is written next to its destination and moved into place with an
+        atomic rename, so readers only ever see a complete snapshot.
+        """
+        header = SNAPSHOT_HEADER.pack(
+            SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, self.version, len(self), len(self.name_blob),
+            self.cell_size, self.origin[0], self.origin[1], self.n_rows, self.n_cols,
+        )
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(header)
+            for array, dtype in (
+                (self.ids, np.int64),
+                (self.prices, np.float64),
+                (self.lats, np.float64),
+                (self.lons, np.float64),
+                (self.name_offsets, np.int64),
+                (self.cell_start, np.int64),
+            ):
+                f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+            f.write(self.name_blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def name(self, position):
+        """Truck stop name of the station at an index position."""
+        start, stop = self.name_offsets[position], self.name_offsets[position + 1]
+        return bytes(self.name_blob[start:stop]).decode('utf-8')
+
+    def _cells(self, lats, lons):
+        rows = ((lats - self.origin[0]) // self.cell_size).astype(np.int64)
+        cols = ((lons - self.origin[1]) // self.cell_size).astype(np.int64)
+        return rows * self.n_cols + cols
+
+    def _cell_spans(self, lats, radius_miles):
+        """
+        Rows and columns of grid cells to search on each side of the points' cells
+        to cover `radius_miles` around them.
+        """
+        max_lat = min(float(np.abs(lats).max()) + radius_miles / MILES_PER_DEGREE, 89.0)
+        row_span = math.ceil(radius_miles / MILES_PER_DEGREE / self.cell_size)
+        col_span = math.ceil(
+            radius_miles / (MILES_PER_DEGREE * math.cos(math.radians(max_lat))) / self.cell_size
+        )
+        return row_span, col_span
+
+    def _stations_near(self, lats, lons, radius_miles):
+        """
+        Positions of all stations in grid cells within `radius_miles` of any of the points.
+        """
+        if not len(self) or not len(lats):
+            return np.empty(0, dtype=np.int64)
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        row_span, col_span = self._cell_spans(lats, radius_miles)
+        rows = ((lats - self.origin[0]) // self.cell_size).astype(np.int64)
+        cols = ((lons - self.origin[1]) // self.cell_size).astype(np.int64)
+        base = np.unique(np.stack([rows, cols], axis=1), axis=0)
+
+        d_rows, d_cols = np.meshgrid(
+            np.arange(-row_span, row_span + 1), np.arange(-col_span, col_span + 1), indexing='ij'
+        )
+        all_rows = (base[:, 0, None] + d_rows.ravel()).ravel()
+        all_cols = (base[:, 1, None] + d_cols.ravel()).ravel()
+        inside = (all_rows >= 0) & (all_rows < self.n_rows) & (all_cols >= 0) & (all_cols < self.n_cols)
+        cells = np.unique(all_rows[inside] * self.n_cols + all_cols[inside])
+
+        starts, stops = self.cell_start[cells], self.cell_start[cells + 1]
+        non_empty = stops > starts
+        starts, stops = starts[non_empty], stops[non_empty]
+        if not len(starts):
+            return np.empty(0, dtype=np.int64)
+        lengths = stops - starts
+        # Concatenate the ranges [start, stop) of every selected cell
+        offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+        return np.arange(lengths.sum()) + offsets
+
+    def radius(self, lat, lon, radius_miles):
+        """
+        Stations within a radius of a point.
+
+        :return: Tuple (positions, distances) of index positions and miles, nearest first.
+        """
+        positions = self._stations_near([lat], [lon], radius_miles)
+        distances = haversine_miles(lat, lon, self.lats[positions], self.lons[positions])
+        inside = distances <= radius_miles
+        positions, distances = positions[inside], distances[inside]
+        order = np.argsort(distances, kind='stable')
+        return positions[order], distances[order]
+
+    def nearest(self, lat, lon, k=1):
+        """
+        The k stations nearest to a point.
+
+        :return: Tuple (positions, distances) of index positions and miles, nearest first;
+                 fewer than k if the index holds fewer stations.
+        """
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64)
+        radius_miles = self.cell_size * MILES_PER_DEGREE
+        while True:
+            row_span, col_span = self._cell_spans(np.array([lat]), radius_miles)
+            if (2 * row_span + 1) * (2 * col_span + 1) >= self.n_rows * self.n_cols:
+                # The search window would cover the whole grid: one pass over every station is cheaper
+                distances = haversine_miles(lat, lon, self.lats, self.lons)
+                positions = np.argsort(distances, kind='stable')[:k]
+                return positions, distances[positions]
+            positions, distances = self.radius(lat, lon, radius_miles)
+            # Every station within the radius was seen, so the first k are the k nearest
+            if len(positions) >= k:
+                return positions[:k], distances[:k]
+            radius_miles *= 2
+
+    def corridor(self, geometry, radius_miles, tolerance=0.01):
+        """
+        Stations within a corridor around a route, positioned along it.
+
+        Stations are measured against the route simplified with `tolerance`
+        (degrees), in a local equirectangular projection.
+
+        :param geometry: RouteGeometry of the route.
+        :param radius_miles: Corridor half-width in miles.
+        :return: List of StationCandidate tuples sorted by mile position.
+        """
+        if len(geometry) < 2 or not len(self):
+            return []
+
+        # Sample the route often enough that every point on it is within half a
+        # step of a sample, then widen the cell search by that half step
+        step = max(radius_miles, self.cell_size * MILES_PER_DEGREE / 2)
+        sample_lats, sample_lons = geometry.markers.positions_at(
+            np.append(np.arange(0.0, geometry.total_miles, step), geometry.total_miles)
+        )
+        positions = self._stations_near(sample_lats, sample_lons, radius_miles + step / 2)
+        if not len(positions):
+            return []
+
+        indices = geometry.simplify_indices(tolerance)
+        seg_lat0, seg_lon0 = geometry.lats[indices[:-1]], geometry.lons[indices[:-1]]
+        seg_dlat = geometry.lats[indices[1:]] - seg_lat0
+        seg_dlon = geometry.lons[indices[1:]] - seg_lon0
+        seg_miles = geometry.cumulative_miles[indices]
+
+        best_distance = np.full(len(positions), np.inf)
+        best_mile = np.zeros(len(positions))
+        chunk = max(1, CORRIDOR_CHUNK_SIZE // len(seg_lat0))
+        for first in range(0, len(positions), chunk):
+            part = positions[first:first + chunk]
+            lats, lons = self.lats[part, None], self.lons[part, None]
+            scale = np.cos(np.radians(lats))
+            # Project to miles around each station, then clamp onto each segment
+            px, py = (lons - seg_lon0) * scale, lats - seg_lat0
+            sx, sy = seg_dlon * scale, seg_dlat
+            length2 = sx ** 2 + sy ** 2
+            with np.errstate(divide='ignore', invalid='ignore'):
+                t = np.clip(np.where(length2 > 0, (px * sx + py * sy) / length2, 0.0), 0.0, 1.0)
+            distance = np.hypot(px - t * sx, py - t * sy) * MILES_PER_DEGREE
+            nearest = np.argmin(distance, axis=1)
+            rows = np.arange(len(part))
+            best_distance[first:first + len(part)] = distance[rows, nearest]
+            best_mile[first:first + len(part)] = (
+                seg_miles[nearest] + t[rows, nearest] * (seg_miles[nearest + 1] - seg_miles[nearest])
+            )
+
+        inside = best_distance <= radius_miles
+        positions, miles, distances = positions[inside], best_mile[inside], best_distance[inside]
+        order = np.argsort(miles, kind='stable')
+        return [
+            self.candidate(position, mile, distance)
+            for position, mile, distance in zip(
+                positions[order].tolist(), miles[order].tolist(), distances[order].tolist()
+            )
+        ]
+
+    def candidate(self, position, mile=0.0, off_route_miles=0.0):
+        """
+        Build a StationCandidate for the station at an index position.
+        """
+        return StationCandidate(
+            int(self.ids[position]), self.name(position), float(self.prices[position]),
+            float(self.lats[position]), float(self.lons[position]), mile, off_route_miles,
+        )
+
+
+def _snapshot_key(path_or_fd):
+    """Identity of a snapshot file; changes whenever a new snapshot is renamed into place."""
+    stat = os.stat(path_or_fd)
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+_index = None
+_index_lock = threading.Lock()
+_last_version_check = 0.0
+
+
+def get_station_index():
+    """
+    Return this worker's station index, loading it on first use.
+
+    With STATION_SNAPSHOT_PATH set, the index is the memory-mapped snapshot and
+    is swapped for the new file whenever a snapshot is rebuilt; otherwise it is
+    loaded from the database and rebuilt when an import bumps the dataset version.
+    Either is re-checked at most every STATION_INDEX_VERSION_CHECK_SECONDS.
+    """
+    global _index, _last_version_check
+    now = time.monotonic()
+    if _index is not None and now - _last_version_check < settings.STATION_INDEX_VERSION_CHECK_SECONDS:
+        return _index
+
+    with _index_lock:
+        if _index is not None and now - _last_version_check < settings.STATION_INDEX_VERSION_CHECK_SECONDS:
+            return _index
+        path = settings.STATION_SNAPSHOT_PATH
+        if path and os.path.exists(path):
+            if _index is None or _index.snapshot_key != _snapshot_key(path):
+                _index = StationIndex.from_snapshot(path)
+        elif _index is None or DatasetVersion.current() != _index.version:
+            _index = StationIndex.from_database()
+        _last_version_check = now
+        return _index
+
+
+def current_dataset_version():
+    """
+    Version of the fuel price data stops are planned from.
+
+    With the station index this is the version the index was built from, so
+    it costs no database query.
+    """
+    if settings.FUEL_STATION_SOURCE == 'index':
+        return get_station_index().version
+    return DatasetVersion.current()
@@ -0,0 +1,78 @@
+from collections import namedtuple
+
+from django.contrib.gis.db.models import GeometryField
+from django.contrib.gis.db.models.functions import Distance, GeoFunc
+from django.contrib.gis.geos import LineString
+from django.contrib.gis.measure import D
+from django.db.models import FloatField, Func
+from django.db.models.functions import Cast
+
+from .models import FuelPrice
+
+# A fuel station near the route: where it is along the route and how far off it
+StationCandidate = namedtuple(
+    'StationCandidate', ['id', 'name', 'price', 'lat', 'lon', 'mile', 'off_route_miles']
+)
+
+
+class LineLocatePoint(GeoFunc):
+    """ST_LineLocatePoint: position of a point along a line, as a fraction of its length."""
+    function = 'ST_LineLocatePoint'
+    output_field = FloatField()
+    arity = 2
+    geom_param_pos = (0, 1)
+
+
+class PointX(Func):
+    function = 'ST_X'
+    output_field = FloatField()
+
+
+class PointY(Func):
+    function = 'ST_Y'
+    output_field = FloatField()
+
+
+def find_corridor_stations(geometry, radius_miles, tolerance=0.01):
+    """
+    Fetch every fuel station within a corridor around the route in a single query.
+
+    The route is simplified before it is sent to PostGIS; along-route positions
+    reported against the simplified line are mapped back onto the full route.
+
+    :param geometry: RouteGeometry of the route.
+    :param radius_miles: Corridor half-width in miles.
+    :param tolerance: Simplification tolerance in degrees for the query line.
+    :return: List of StationCandidate tuples sorted by mile position.
+    """
+    if len(geometry) < 2:
+        return []
+
+    indices = geometry.simplify_indices(tolerance)
+    line = LineString(
+        list(zip(geometry.lons[indices].tolist(), geometry.lats[indices].tolist())),
+        srid=4326,
+    )
+    point = Cast('location', GeometryField(srid=4326))
+
+    rows = list(
+        FuelPrice.objects
+        .filter(location__dwithin=(line, D(mi=radius_miles)))
+        .annotate(
+            lat=PointY(point),
+            lon=PointX(point),
+            fraction=LineLocatePoint(line, point),
+            off_route=Distance('location', line),
+        )
+        .values_list('id', 'truckstop_name', 'retail_price', 'lat', 'lon', 'fraction', 'off_route')
+    )
+    if not rows:
+        return []
+
+    miles = geometry.miles_at_fractions(indices, [row[5] for row in rows]).tolist()
+    candidates = [
+        StationCandidate(pk, name, price, lat, lon, mile, off_route.mi)
+        for (pk, name, price, lat, lon, _, off_route), mile in zip(rows, miles)
+    ]
+    candidates.sort(key=lambda candidate: candidate.mile)
+    return candidates
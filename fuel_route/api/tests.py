@@ -1,3 +1,609 @@
-from django.test import TestCase
+import asyncio
+import random
+import threading
+import time
+from collections import namedtuple
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+import polyline
+from django.core.cache import cache
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from api import metrics
+from api.geometry import METERS_PER_MILE, RouteGeometry, haversine_miles
+from api.permissions import HasMetricsToken
+from api.planner import RefuelPlanError, plan_refuelling
+from api.quantize import normalize_endpoint, quantize_coordinate, snap_to_known_endpoint
+from api.route_cache import ROUTE_HEADER, ROUTE_SCHEMA_VERSION, CachedRoute, LRUCache, TieredRouteCache
+from api.singleflight import BackgroundRefresher, SingleFlight
+
+# Stand-in for StationCandidate: the planner only reads `mile` and `price`
+Station = namedtuple('Station', ['mile', 'price'])
+
+
+def counter(name):
+    """Current value of a metrics counter of this process."""
+    return metrics.snapshot()['counters'].get(name, 0)
+
+
+def wait_until(condition, timeout=5):
+    """Poll `condition` until it is true; fail the test after `timeout` seconds."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            raise AssertionError('Timed out waiting for a condition')
+        time.sleep(0.005)
+
+
+def make_directions(points=((30.27, -97.74), (31.5, -97.1), (32.78, -96.8)), distance=290000.0, duration=10800.0):
+    """A minimal ORS directions response: one route through (lat, lon) `points`."""
+    return {'routes': [{
+        'geometry': polyline.encode(list(points)),
+        'summary': {'distance': distance, 'duration': duration},
+    }]}
+
+
+def distance_m(a, b):
+    """Distance in metres between two [longitude, latitude] points."""
+    return float(haversine_miles(a[1], a[0], b[1], b[0])) * METERS_PER_MILE
+
+
+def brute_force_cost(stations, route_miles, tank_size, start_fuel):
+    """
+    Cheapest total cost at 1 mpg, by dynamic programming over whole gallons.
+
+    With whole-mile distances and a whole-gallon tank and start fuel, some
+    cheapest plan only buys whole gallons, so this is the exact optimum.
+
+    :return: Total cost, or None if the route cannot be driven.
+    """
+    stations = sorted(stations, key=lambda station: station.mile)
+    miles = [station.mile for station in stations] + [route_miles]
+    # Cheapest cost of arriving at the next node with each fuel level
+    costs = {start_fuel - miles[0]: 0} if miles[0] <= start_fuel else {}
+    for i, station in enumerate(stations):
+        leg = miles[i + 1] - miles[i]
+        arrivals = {}
+        for fuel, cost in costs.items():
+            for bought in range(tank_size - fuel + 1):
+                if fuel + bought >= leg:
+                    arrival = fuel + bought - leg
+                    total = cost + bought * station.price
+                    if total < arrivals.get(arrival, float('inf')):
+                        arrivals[arrival] = total
+        costs = arrivals
+    return min(costs.values()) if costs else None
+
+
+class PlanRefuellingTests(SimpleTestCase):
+
+    def test_no_purchase_when_the_start_fuel_is_enough(self):
+        stations = [Station(10, 3.0), Station(40, 2.0)]
+        self.assertEqual(plan_refuelling(stations, 90, tank_size=10, mpg=10), [])
+
+    def test_buys_just_enough_to_reach_a_cheaper_station(self):
+        expensive, cheap = Station(0, 4.0), Station(50, 3.0)
+        plan = plan_refuelling([expensive, cheap], 150, tank_size=10, mpg=10, start_fuel=2)
+        self.assertEqual(
+            [(refuel.station, refuel.gallons, refuel.cost) for refuel in plan],
+            [(expensive, 3.0, 12.0), (cheap, 10.0, 30.0)],
+        )
+
+    def test_fills_up_and_drives_to_the_cheapest_station_in_range(self):
+        stations = [Station(0, 3.0), Station(60, 5.0), Station(90, 4.0), Station(180, 4.5)]
+        plan = plan_refuelling(stations, 250, tank_size=10, mpg=10, start_fuel=0)
+        self.assertEqual(
+            [(refuel.station.mile, refuel.gallons) for refuel in plan],
+            [(0, 10.0), (90, 9.0), (180, 6.0)],
+        )
+        self.assertAlmostEqual(sum(refuel.cost for refuel in plan), 93.0)
+
+    def test_empty_tank_buys_at_a_station_on_the_start(self):
+        plan = plan_refuelling([Station(0, 3.0)], 50, tank_size=10, mpg=10, start_fuel=0)
+        self.assertEqual([(refuel.station.mile, refuel.gallons) for refuel in plan], [(0, 5.0)])
+
+    def test_empty_tank_without_a_station_on_the_start(self):
+        with self.assertRaises(RefuelPlanError):
+            plan_refuelling([Station(5, 3.0)], 50, tank_size=10, mpg=10, start_fuel=0)
+
+    def test_gap_longer_than_the_range(self):
+        stations = [Station(0, 3.0), Station(50, 3.0)]
+        with self.assertRaises(RefuelPlanError):
+            plan_refuelling(stations, 300, tank_size=10, mpg=10)
+
+    def test_ignores_stations_off_the_route_span(self):
+        stations = [Station(-20, 1.0), Station(0, 3.0), Station(120, 1.0)]
+        plan = plan_refuelling(stations, 100, tank_size=10, mpg=10, start_fuel=0)
+        self.assertEqual([(refuel.station.mile, refuel.gallons) for refuel in plan], [(0, 10.0)])
+
+    def test_matches_brute_force(self):
+        rng = random.Random(4)
+        for _ in range(300):
+            route_miles = rng.randint(1, 30)
+            tank_size = rng.randint(3, 10)
+            start_fuel = rng.randint(0, tank_size)
+            # A station at the start, so that an empty tank is not always stuck
+            stations = [Station(0, float(rng.randint(1, 9)))] + [
+                Station(rng.randint(0, route_miles), float(rng.randint(1, 9)))
+                for _ in range(rng.randint(0, 10))
+            ]
+            expected = brute_force_cost(stations, route_miles, tank_size, start_fuel)
+            with self.subTest(stations=stations, route_miles=route_miles,
+                              tank_size=tank_size, start_fuel=start_fuel):
+                if expected is None:
+                    with self.assertRaises(RefuelPlanError):
+                        plan_refuelling(stations, route_miles, tank_size=tank_size, mpg=1,
+                                        start_fuel=start_fuel)
+                    continue
+                plan = plan_refuelling(stations, route_miles, tank_size=tank_size, mpg=1,
+                                       start_fuel=start_fuel)
+                self.assertAlmostEqual(sum(refuel.cost for refuel in plan), expected)
+                self.assertTrue(all(0 < refuel.gallons <= tank_size for refuel in plan))
+
+
+class MileMarkerIndexTests(SimpleTestCase):
+
+    def test_position_at(self):
+        geometry = RouteGeometry.from_points([(30.0, -97.0), (30.0, -96.0), (31.0, -96.0)])
+        markers = geometry.markers
+        self.assertEqual(markers.position_at(0), (30.0, -97.0))
+        self.assertEqual(markers.position_at(geometry.total_miles), (31.0, -96.0))
+        lat, lon = markers.position_at(geometry.cumulative_miles[1] / 2)
+        self.assertAlmostEqual(lat, 30.0)
+        self.assertAlmostEqual(lon, -96.5)
+        # Positions are clamped to the route
+        self.assertEqual(markers.position_at(-5), (30.0, -97.0))
+        self.assertEqual(markers.position_at(geometry.total_miles + 5), (31.0, -96.0))
+
+    def test_single_point_route(self):
+        markers = RouteGeometry.from_points([(30.0, -97.0)]).markers
+        self.assertEqual(markers.position_at(0), (30.0, -97.0))
+        self.assertEqual(markers.position_at(10), (30.0, -97.0))
+
+    def test_empty_route_is_rejected(self):
+        with self.assertRaises(ValueError):
+            RouteGeometry.from_points([])
+        with self.assertRaises(ValueError):
+            RouteGeometry.from_polyline('')
+
+
+class QuantizeTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_quantize_moves_a_point_less_than_a_cell(self):
+        rng = random.Random(12)
+        for _ in range(200):
+            point = [rng.uniform(-125, -67), rng.uniform(25, 49)]
+            snapped = quantize_coordinate(point, 25)
+            # Half the diagonal of a 25 m cell
+            self.assertLess(distance_m(point, snapped), 25 / 2 ** 0.5 + 0.01)
+            self.assertEqual(quantize_coordinate(snapped, 25), snapped)
+
+    def test_quantize_merges_nearby_points(self):
+        point = quantize_coordinate([-97.74, 30.27], 25)
+        self.assertEqual(quantize_coordinate([point[0] + 0.00003, point[1] - 0.00003], 25), point)
+
+    def test_snap_to_a_known_endpoint_within_tolerance(self):
+        known = snap_to_known_endpoint([-97.74, 30.27], 150)
+        self.assertEqual(known, [-97.74, 30.27])
+
+        snapped = counter('directions.endpoint_snapped')
+        nearby = [-97.7405, 30.2705]  # about 70 m away
+        self.assertEqual(snap_to_known_endpoint(nearby, 150), known)
+        self.assertEqual(counter('directions.endpoint_snapped'), snapped + 1)
+
+    def test_no_snap_beyond_tolerance(self):
+        snap_to_known_endpoint([-97.74, 30.27], 150)
+        far = [-97.742, 30.272]  # about 290 m away
+        self.assertEqual(snap_to_known_endpoint(far, 150), far)
+        # ...and it is now a known endpoint itself
+        self.assertEqual(snap_to_known_endpoint([-97.7421, 30.2721], 150), far)
+
+    def test_known_endpoint_is_not_counted_as_snapped(self):
+        snap_to_known_endpoint([-97.74, 30.27], 150)
+        snapped = counter('directions.endpoint_snapped')
+        self.assertEqual(snap_to_known_endpoint([-97.74, 30.27], 150), [-97.74, 30.27])
+        self.assertEqual(counter('directions.endpoint_snapped'), snapped)
+
+    def test_snap_across_cell_borders(self):
+        rng = random.Random(13)
+        for _ in range(100):
+            cache.clear()
+            point = [rng.uniform(-125, -67), rng.uniform(25, 49)]
+            snap_to_known_endpoint(point, 150)
+            # Up to 100 m away in any direction, often in a neighbouring cell
+            nearby = [point[0] + rng.uniform(-0.001, 0.001), point[1] + rng.uniform(-0.0006, 0.0006)]
+            if distance_m(point, nearby) <= 150:
+                self.assertEqual(snap_to_known_endpoint(nearby, 150), point)
+
+    @override_settings(DIRECTIONS_CACHE_QUANTIZATION={'precision_m': 25, 'snap_tolerance_m': 150})
+    def test_normalize_endpoint(self):
+        first = normalize_endpoint([-97.74, 30.27])
+        self.assertEqual(first, quantize_coordinate([-97.74, 30.27], 25))
+        self.assertEqual(normalize_endpoint(['-97.7405', '30.2705']), first)
+
+    @override_settings(DIRECTIONS_CACHE_QUANTIZATION={'precision_m': None, 'snap_tolerance_m': None})
+    def test_normalize_endpoint_disabled(self):
+        self.assertEqual(normalize_endpoint([-97.74, 30.27]), [-97.74, 30.27])
+        self.assertEqual(normalize_endpoint([-97.7405, 30.2705]), [-97.7405, 30.2705])
+
+
+class CachedRouteTests(SimpleTestCase):
+
+    def assertSameRoute(self, route, expected):
+        self.assertEqual(route.geometry, expected.geometry)
+        self.assertEqual(route.distance, expected.distance)
+        self.assertEqual(route.duration, expected.duration)
+        self.assertEqual(route.distance_method, expected.distance_method)
+        self.assertEqual(route.fresh_until, expected.fresh_until)
+        self.assertEqual(route.expires_at, expected.expires_at)
+        if expected.cumulative_miles is None:
+            self.assertIsNone(route.cumulative_miles)
+        else:
+            np.testing.assert_array_equal(route.cumulative_miles, expected.cumulative_miles)
+
+    def test_from_directions(self):
+        route = CachedRoute.from_directions(make_directions())
+        self.assertEqual((route.distance, route.duration), (290000.0, 10800.0))
+        self.assertIsNone(route.cumulative_miles)
+        self.assertIsNone(CachedRoute.from_directions({'routes': []}))
+        self.assertIsNone(CachedRoute.from_directions({'routes': [{'geometry': '', 'summary': {}}]}))
+        self.assertIsNone(CachedRoute.from_directions(None))
+
+    def test_round_trip(self):
+        route = CachedRoute.from_directions(make_directions())
+        route.fresh_until, route.expires_at = 1700000600.5, 1700003600.25
+        self.assertSameRoute(CachedRoute.from_bytes(route.to_bytes()), route)
+
+    def test_round_trip_with_cumulative_miles(self):
+        for method in ('haversine', 'ellipsoidal'):
+            route = CachedRoute.from_directions(make_directions(), distance_method=method)
+            self.assertEqual(len(route.cumulative_miles), 3)
+            restored = CachedRoute.from_bytes(route.to_bytes())
+            self.assertSameRoute(restored, route)
+            # The stored miles are reused, and match a fresh computation
+            self.assertAlmostEqual(
+                restored.to_geometry(method).total_miles,
+                CachedRoute.from_directions(make_directions()).to_geometry(method).total_miles,
+            )
+
+    def test_blob_is_compact(self):
+        points = [(30 + i * 0.001, -97 - i * 0.001) for i in range(5000)]
+        route = CachedRoute.from_directions(make_directions(points))
+        self.assertLess(len(route.to_bytes()), len(route.geometry))
+
+    def test_other_schema_versions_are_misses(self):
+        blob = bytearray(CachedRoute.from_directions(make_directions()).to_bytes())
+        blob[2] = ROUTE_SCHEMA_VERSION + 1
+        self.assertIsNone(CachedRoute.from_bytes(bytes(blob)))
+
+    def test_invalid_blobs_are_misses(self):
+        blob = CachedRoute.from_directions(make_directions()).to_bytes()
+        self.assertIsNone(CachedRoute.from_bytes(None))
+        self.assertIsNone(CachedRoute.from_bytes(blob[:ROUTE_HEADER.size - 1]))
+        self.assertIsNone(CachedRoute.from_bytes(b'XX' + blob[2:]))
+        # Entries cached before the compact format held the raw directions response
+        self.assertIsNone(CachedRoute.from_bytes(make_directions()))
+
+
+class LRUCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        self.expires_at = time.time() + 60
+
+    def test_evicts_least_recently_used_entries(self):
+        lru = LRUCache('test_lru', max_entries=2, max_bytes=1000)
+        lru.set('a', 'A', 1, self.expires_at)
+        lru.set('b', 'B', 1, self.expires_at)
+        lru.get('a')
+        lru.set('c', 'C', 1, self.expires_at)
+        self.assertEqual((lru.get('a'), lru.get('b'), lru.get('c')), ('A', None, 'C'))
+        self.assertEqual(len(lru.entries), 2)
+
+    def test_evicts_down_to_max_bytes(self):
+        lru = LRUCache('test_lru', max_entries=10, max_bytes=100)
+        for key in 'abc':
+            lru.set(key, key.upper(), 40, self.expires_at)
+        self.assertEqual(list(lru.entries), ['b', 'c'])
+        self.assertEqual(lru.bytes, 80)
+        # Replacing an entry frees its old size
+        lru.set('b', 'B2', 10, self.expires_at)
+        self.assertEqual(lru.bytes, 50)
+        self.assertEqual(list(lru.entries), ['c', 'b'])
+
+    def test_oversized_values_are_not_stored(self):
+        lru = LRUCache('test_lru', max_entries=10, max_bytes=100)
+        lru.set('a', 'A', 10, self.expires_at)
+        lru.set('big', 'BIG', 101, self.expires_at)
+        self.assertIsNone(lru.get('big'))
+        self.assertEqual(lru.get('a'), 'A')
+
+    def test_expired_entries(self):
+        lru = LRUCache('test_lru', max_entries=10, max_bytes=100)
+        lru.set('a', 'A', 10, time.time() - 1)
+        self.assertIsNone(lru.get('a'))
+        self.assertEqual(lru.bytes, 0)
+
+    def test_delete_and_clear(self):
+        lru = LRUCache('test_lru', max_entries=10, max_bytes=100)
+        lru.set('a', 'A', 10, self.expires_at)
+        lru.set('b', 'B', 10, self.expires_at)
+        lru.delete('a')
+        self.assertEqual((lru.get('a'), lru.bytes), (None, 10))
+        lru.clear()
+        self.assertEqual((lru.get('b'), lru.bytes), (None, 0))
+
+
+class TieredRouteCacheTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def make_cache(self, **kwargs):
+        return TieredRouteCache(max_entries=10, max_bytes=10 ** 6, local_ttl=300, **kwargs)
+
+    def test_set_and_get(self):
+        routes = self.make_cache()
+        route = CachedRoute.from_directions(make_directions())
+        routes.set('directions:a', route, timeout=3600)
+        self.assertIs(routes.get('directions:a'), route)
+        # Another process reads the shared tier
+        other = self.make_cache().get('directions:a')
+        self.assertEqual((other.geometry, other.distance), (route.geometry, route.distance))
+        self.assertIsNone(routes.get('directions:b'))
+
+    def test_local_tier_is_decoded(self):
+        routes = self.make_cache(distance_method='haversine')
+        routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600)
+        other = self.make_cache(distance_method='haversine')
+        self.assertIsNotNone(other.get('directions:a')._decoded)
+
+    def test_invalidate_all(self):
+        routes = self.make_cache()
+        other = self.make_cache(generation_check_interval=0)
+        routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600)
+        self.assertIsNotNone(other.get('directions:a'))
+
+        generation = routes.invalidate_all()
+        self.assertEqual(routes.generation, generation)
+        self.assertIsNone(routes.get('directions:a'))
+        # The other process notices the new generation and drops its local tier too
+        self.assertIsNone(other.get('directions:a'))
+        self.assertEqual(len(other.local.entries), 0)
+
+        self.assertEqual(routes.invalidate_all(), generation + 1)
+        routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600)
+        self.assertIsNotNone(routes.get('directions:a'))
+
+    def test_generation_is_rechecked_after_the_interval(self):
+        routes = self.make_cache()
+        other = self.make_cache(generation_check_interval=60)
+        routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600)
+        self.assertIsNotNone(other.get('directions:a'))
+        routes.invalidate_all()
+        # Within the interval the other process still serves its local tier
+        self.assertIsNotNone(other.get('directions:a'))
+        with mock.patch('time.monotonic', return_value=time.monotonic() + 61):
+            self.assertIsNone(other.get('directions:a'))
+
+    def test_invalidate_all_survives_an_evicted_generation(self):
+        routes = self.make_cache()
+        first = routes.invalidate_all()
+        cache.delete(TieredRouteCache.GENERATION_KEY)
+        self.assertGreater(routes.invalidate_all(), first)
+
+    def test_evicted_generation_invalidates_routes(self):
+        routes = self.make_cache(generation_check_interval=0)
+        routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600)
+        routes.invalidate_all()
+        routes.set('directions:b', CachedRoute.from_directions(make_directions()), timeout=3600)
+        cache.delete(TieredRouteCache.GENERATION_KEY)
+        # Falling back to an earlier generation would serve its routes again
+        self.assertIsNone(routes.get('directions:a'))
+        self.assertIsNone(routes.get('directions:b'))
+
+
+class SingleFlightTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.store = {}
+        self.computes = 0
+        self.lookups = 0
+        self.release = threading.Event()
+
+    def compute(self):
+        self.computes += 1
+        self.release.wait(5)
+        self.store['value'] = 'computed'
+        return 'computed'
+
+    def lookup(self):
+        self.lookups += 1
+        return self.store.get('value')
+
+    def run_threads(self, flights):
+        """Call flights[i].do in a thread each, the first one leading; return their results."""
+        results = [None] * len(flights)
+
+        def call(i):
+            results[i] = flights[i].do('key', self.compute, self.lookup)
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(len(flights))]
+        threads[0].start()
+        wait_until(lambda: self.computes)
+        for thread in threads[1:]:
+            thread.start()
+        return threads, results
+
+    def test_coalesces_concurrent_calls_in_a_process(self):
+        flight = SingleFlight('test_flight')
+        coalesced = counter('test_flight.coalesced.local')
+        threads, results = self.run_threads([flight] * 5)
+        wait_until(lambda: counter('test_flight.coalesced.local') == coalesced + 4)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['computed'] * 5)
+        self.assertEqual(self.computes, 1)
+
+    def test_leader_error_reaches_local_followers(self):
+        flight = SingleFlight('test_flight')
+        errors = []
+
+        def fail():
+            self.release.wait(5)
+            raise ValueError('upstream down')
+
+        def call():
+            try:
+                flight.do('key', fail, self.lookup)
+            except ValueError as exc:
+                errors.append(exc)
+        coalesced = counter('test_flight.coalesced.local')
+        threads = [threading.Thread(target=call) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: counter('test_flight.coalesced.local') == coalesced + 2)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(errors), 3)
+        # The lock is released, so the next call computes again
+        self.assertEqual(flight.do('key', lambda: 'retried', self.lookup), 'retried')
+
+    def test_waits_for_the_leader_of_another_process(self):
+        # Two instances share the cache like two worker processes
+        leader, follower = SingleFlight('test_flight'), SingleFlight('test_flight', poll_interval=0.01)
+        threads, results = self.run_threads([leader, follower])
+        time.sleep(0.1)
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, ['computed', 'computed'])
+        self.assertEqual(self.computes, 1)
+        # One lookup per caller, however long the follower polled
+        self.assertEqual(self.lookups, 2)
+
+    def test_computes_after_the_wait_timeout(self):
+        flight = SingleFlight('test_flight', wait_timeout=0.05, poll_interval=0.01)
+        cache.add('test_flight:lock:key', 'other process', timeout=60)
+        timeouts = counter('test_flight.wait_timeout')
+        self.release.set()
+        self.assertEqual(flight.do('key', self.compute, self.lookup), 'computed')
+        self.assertEqual(counter('test_flight.wait_timeout'), timeouts + 1)
+        # The other process's lock is left alone
+        self.assertEqual(cache.get('test_flight:lock:key'), 'other process')
+
+    def test_async_calls_are_coalesced(self):
+        flight = SingleFlight('test_flight')
+
+        async def compute():
+            self.computes += 1
+            await asyncio.sleep(0.05)
+            self.store['value'] = 'computed'
+            return 'computed'
+
+        async def lookup():
+            return self.lookup()
+
+        async def main():
+            return await asyncio.gather(*(flight.ado('key', compute, lookup) for _ in range(5)))
+        self.assertEqual(asyncio.run(main()), ['computed'] * 5)
+        self.assertEqual(self.computes, 1)
+        self.assertIsNone(cache.get('test_flight:lock:key'))
+
+
+class StaleWhileRevalidateTests(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.routes = TieredRouteCache(max_entries=10, max_bytes=10 ** 6, local_ttl=300)
+
+    def test_soft_and_hard_timeouts(self):
+        now = time.time()
+        self.routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600, soft_timeout=600)
+        route = self.routes.get('directions:a')
+        self.assertFalse(route.is_stale)
+        self.assertAlmostEqual(route.fresh_until, now + 600, delta=5)
+        self.assertAlmostEqual(route.expires_at, now + 3600, delta=5)
+
+        # Past the soft timeout the route is still served, from the shared tier once the local one expired
+        with mock.patch('time.time', return_value=now + 1800):
+            route = self.routes.get('directions:a')
+            self.assertIsNotNone(route)
+            self.assertTrue(route.is_stale)
+        # Past the hard timeout it is gone
+        with mock.patch('time.time', return_value=now + 3601):
+            self.assertIsNone(self.routes.get('directions:a'))
+
+    def test_soft_timeout_defaults_to_and_is_capped_at_the_timeout(self):
+        self.routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=60)
+        self.routes.set('directions:b', CachedRoute.from_directions(make_directions()), timeout=60, soft_timeout=600)
+        for key in ('directions:a', 'directions:b'):
+            route = self.routes.get(key)
+            self.assertEqual(route.fresh_until, route.expires_at)
+
+    def test_stale_local_route_is_replaced_by_a_refreshed_one(self):
+        other = TieredRouteCache(max_entries=10, max_bytes=10 ** 6, local_ttl=300)
+        now = time.time()
+        self.routes.set('directions:a', CachedRoute.from_directions(make_directions()), timeout=3600, soft_timeout=60)
+        self.assertIsNotNone(other.get('directions:a'))
+        with mock.patch('time.time', return_value=now + 120):
+            # Another process refreshes the stale route
+            self.routes.set(
+                'directions:a', CachedRoute.from_directions(make_directions(distance=1.0)),
+                timeout=3600, soft_timeout=60,
+            )
+            route = other.get('directions:a')
+        self.assertEqual(route.distance, 1.0)
+        self.assertFalse(route.is_stale)
+
+    def test_refresher_runs_once_per_key(self):
+        refresher = BackgroundRefresher('test_refresh', workers=2, lock_timeout=60)
+        release, calls = threading.Event(), []
+
+        def refresh():
+            calls.append(1)
+            release.wait(5)
+        self.assertTrue(refresher.schedule('key', refresh))
+        # Already being refreshed in this process
+        self.assertFalse(refresher.schedule('key', refresh))
+        release.set()
+        wait_until(lambda: 'key' not in refresher._pending)
+        # Refreshed by this or another process less than `lock_timeout` ago
+        self.assertTrue(refresher.schedule('key', refresh))
+        wait_until(lambda: 'key' not in refresher._pending)
+        self.assertEqual(len(calls), 1)
+
+    def test_refresher_swallows_failures(self):
+        refresher = BackgroundRefresher('test_refresh', lock_timeout=60)
+        failed = counter('test_refresh.failed')
+
+        def refresh():
+            raise ValueError('upstream down')
+        refresher.schedule('key', refresh)
+        wait_until(lambda: counter('test_refresh.failed') == failed + 1)
+
+
+class HasMetricsTokenTests(SimpleTestCase):
+
+    def allowed(self, authorization=None):
+        headers = {'HTTP_AUTHORIZATION': authorization} if authorization is not None else {}
+        return HasMetricsToken().has_permission(RequestFactory().get('/api/metrics/', **headers), None)
+
+    @override_settings(METRICS_TOKEN='s3cret')
+    def test_token(self):
+        self.assertTrue(self.allowed('Bearer s3cret'))
+        self.assertTrue(self.allowed('bearer s3cret'))
+        self.assertFalse(self.allowed('Bearer wrong'))
+        self.assertFalse(self.allowed('Basic s3cret'))
+        self.assertFalse(self.allowed())
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_no_token_configured(self):
+        self.assertFalse(self.allowed('Bearer '))
+        self.assertFalse(self.allowed('Bearer None'))
+        self.assertFalse(self.allowed())
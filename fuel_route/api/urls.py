@@ -1,6 +1,10 @@
-from django.urls import path
-from api.views import RouteView
+from django.urls import path, re_path
+from api.views import BatchRouteView, MatrixRouteView, MetricsView, RouteView, async_route_view
 
 urlpatterns = [
     path('route/', RouteView.as_view(), name='route'),
+    path('route/async/', async_route_view, name='route-async'),
+    re_path(r'^routes/batch/?$', BatchRouteView.as_view(), name='routes-batch'),
+    re_path(r'^routes/matrix/?$', MatrixRouteView.as_view(), name='routes-matrix'),
+    path('metrics/', MetricsView.as_view(), name='metrics'),
 ]
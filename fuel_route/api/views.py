@@ -1,10 +1,21 @@
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import HttpResponse, HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from api.serializers import RouteRequestSerializer
-from api.services import (
-    get_route_with_stops, calculate_route_distance,
-    calculate_fuel_cost, generate_google_maps_map_url
+from api import metrics
+from api.http_client import UpstreamRejected, UpstreamUnavailable
+from api.permissions import HasMetricsToken
+from api.planner import RefuelPlanError
+from api.renderers import dumps
+from api.batch import route_batch, route_matrix
+from api.serializers import (
+    RESPONSE_OPTIONS, BatchRouteRequestSerializer, MatrixRouteRequestSerializer, RouteRequestSerializer,
 )
+from api.services import aget_route_response, get_route_response
 
 
 class RouteView(APIView):
@@ -16,31 +27,128 @@ class RouteView(APIView):
         start = serializer.validated_data['start']
         end = serializer.validated_data['end']
 
-        # Get the route and stops
-        route, stops_df = get_route_with_stops(start, end)
+        # Get the route, the planned fuel stops, their cost and the map URL
+        try:
+            response = get_route_response(
+                start, end,
+                tank_size=serializer.validated_data['tank_size'],
+                mpg=serializer.validated_data['mpg'],
+                start_fuel=serializer.validated_data.get('start_fuel'),
+                # Geometry format and field selection
+                **{option: serializer.validated_data.get(option) for option in RESPONSE_OPTIONS},
+            )
+        except RefuelPlanError as exc:
+            return Response({"error": str(exc)}, status=400)
+        except UpstreamUnavailable:
+            return Response({"error": "The routing service is unavailable, please retry later"}, status=503)
+        except UpstreamRejected as exc:
+            return Response({"error": f"The routing service rejected the request ({exc.status_code})"}, status=502)
 
-        if route is None:
+        if response is None:
             return Response(
                 {"error": "Unable to find a route"}, 
                 status=400
             )
 
-        # Calculate the total distance of the route (In miles)
-        route_distance = calculate_route_distance(route)
+        return Response(response)
+
+
+class BatchRouteView(APIView):
+    def post(self, request):
+        """
+        Plan many lanes in one call. Results stream back as newline-delimited JSON,
+        one line per lane as soon as it is planned (not in request order), then a
+        final line with the batch summary.
+        """
+        serializer = BatchRouteRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        vehicle = {
+            field: serializer.validated_data.get(field) for field in ('tank_size', 'mpg', 'start_fuel')
+        }
+        options = {option: serializer.validated_data.get(option) for option in RESPONSE_OPTIONS}
+        lines = (
+            dumps(result) + b'\n'
+            for result in route_batch(serializer.validated_data['lanes'], vehicle, options)
+        )
+        return StreamingHttpResponse(lines, content_type='application/x-ndjson')
+
+
+class MatrixRouteView(APIView):
+    def post(self, request):
+        """
+        Fuel cost, distance and duration from every origin to every destination.
+        """
+        serializer = MatrixRouteRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=400)
+
+        data = serializer.validated_data
+        return Response(route_matrix(
+            data['origins'], data['destinations'],
+            {field: data.get(field) for field in ('tank_size', 'mpg', 'start_fuel')},
+            include_geometry=data['include_geometry'],
+        ))
+
+
+async def async_route_view(request):
+    """
+    Async version of RouteView for ASGI servers, taking the same request body.
+
+    The U.S. boundary checks run in a thread while the route is fetched, so a
+    request holds no thread while it waits on the routing provider.
+    """
+    if request.method != 'POST':
+        return HttpResponseNotAllowed(['POST'])
+    try:
+        data = json.loads(request.body)
+    except ValueError:
+        return JsonResponse({"error": "Request body must be JSON"}, status=400)
+
+    serializer = RouteRequestSerializer(data=data, context={'check_boundaries': False})
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=400)
+    validated = serializer.validated_data
+
+    route = asyncio.ensure_future(aget_route_response(
+        validated['start'], validated['end'],
+        tank_size=validated['tank_size'],
+        mpg=validated['mpg'],
+        start_fuel=validated.get('start_fuel'),
+        **{option: validated.get(option) for option in RESPONSE_OPTIONS},
+    ))
+    try:
+        errors = await sync_to_async(serializer.boundary_errors, thread_sensitive=False)()
+        if errors:
+            route.cancel()
+            return JsonResponse(errors, status=400)
+        response = await route
+    except RefuelPlanError as exc:
+        return JsonResponse({"error": str(exc)}, status=400)
+    except UpstreamUnavailable:
+        return JsonResponse({"error": "The routing service is unavailable, please retry later"}, status=503)
+    except UpstreamRejected as exc:
+        return JsonResponse({"error": f"The routing service rejected the request ({exc.status_code})"}, status=502)
+    finally:
+        route.cancel()
+
+    if response is None:
+        return JsonResponse({"error": "Unable to find a route"}, status=400)
+    # Rendered like RouteView's responses, including the NumPy values
+    return HttpResponse(dumps(response), content_type='application/json')
+
 
-        # Prepare stops data
-        stop_data = stops_df.to_dict(orient='records')
+# Exempt like DRF views; Django's csrf_exempt decorator does not support async views
+async_route_view.csrf_exempt = True
 
-        # Calculate total fuel cost
-        total_fuel_cost = calculate_fuel_cost(route_distance, stop_data)
 
-        # Generate the map URL
-        map_url = generate_google_maps_map_url(route)
+class MetricsView(APIView):
+    # Staff users, or scrapers presenting METRICS_TOKEN
+    permission_classes = [IsAdminUser | HasMetricsToken]
 
-        # Format the response
-        return Response({
-            "route": route,  # A list of coordinates (lat, lon)
-            "fuel_stops": stop_data,
-            "total_fuel_cost": total_fuel_cost,
-            "map_url": map_url
-        })
+    def get(self, request):
+        """
+        Counters, gauges and latency histograms of the worker process serving the request.
+        """
+        return Response(metrics.snapshot())
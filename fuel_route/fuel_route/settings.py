@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 
+import math
 import os
 from pathlib import Path
 from urllib.parse import urlparse
@@ -47,6 +48,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'api.middleware.CompressionMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -58,13 +60,132 @@ MIDDLEWARE = [
 
 CORS_ALLOW_ALL_ORIGINS = True
 
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        # orjson-backed JSON renderer, serializing NumPy values natively
+        'api.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+}
+
+# Opt-in compression of responses of at least `min_size` bytes, with the first of `encodings` ('br', which
+# needs the brotli package, or 'gzip') the client accepts, e.g. RESPONSE_COMPRESSION=br,gzip. Off by default,
+# for deployments where the proxy in front already compresses.
+RESPONSE_COMPRESSION = {
+    'encodings': [encoding for encoding in os.getenv("RESPONSE_COMPRESSION", "").split(",") if encoding],
+    'min_size': 1024,
+    'gzip_level': 6,
+    'brotli_quality': 4,
+}
+
 ORS_API_KEY = os.getenv('ORS_API_KEY')
 OPEN_CAGE_API_KEY = os.getenv('OPEN_CAGE_API_KEY')
 GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 LOCATIONIQ_API_KEY = os.getenv('LOCATIONIQ_API_KEY')
+# Bearer token a metrics scraper presents to read /api/metrics/ (otherwise reserved to staff users)
+METRICS_TOKEN = os.getenv('METRICS_TOKEN')
+# Geocoding providers used by import_fuel_data, in failover order; `rate` is requests per second.
+# Use [{'name': 'stub'}] to run imports against the offline stub geocoder.
+GEOCODING_PROVIDERS = [
+    {'name': 'nominatim', 'rate': 1},
+    {'name': 'opencage', 'rate': 1, 'api_key': OPEN_CAGE_API_KEY},
+    {'name': 'locationiq', 'rate': 2, 'api_key': LOCATIONIQ_API_KEY},
+]
+GEOCODING_WORKERS = 8
+GEOCODING_RETRIES = 2
+GEOCODING_TIMEOUT = 10
+# SQLite cache of geocoded addresses; copy it between environments to skip geocoding entirely
+GEOCODE_CACHE_PATH = os.getenv("GEOCODE_CACHE_PATH", str(BASE_DIR / 'api' / 'data' / 'geocode_cache.sqlite3'))
+# Seconds before an address no provider could find is geocoded again (see import_fuel_data --retry-misses)
+GEOCODE_MISS_RETRY_AGE = 30 * 24 * 3600
 GDAL_LIBRARY_PATH = os.getenv("GDAL_LIBRARY_PATH", "/usr/lib/x86_64-linux-gnu/libgdal.so")  
 GEOS_LIBRARY_PATH = os.getenv("GEOS_LIBRARY_PATH", "/usr/lib/x86_64-linux-gnu/libgeos_c.so")  
 
+# Where directions come from: 'openrouteservice' (the ORS API), 'offline' (recorded responses, or a
+# synthesized great-circle route, without network access) or 'stub' (ORS protocol against the local
+# routing stub started with `python manage.py run_routing_stub`)
+ROUTING_BACKEND = os.getenv("ROUTING_BACKEND", "openrouteservice")
+ROUTING_STUB_HOST = os.getenv("ROUTING_STUB_HOST", "127.0.0.1")
+ROUTING_STUB_PORT = int(os.getenv("ROUTING_STUB_PORT", "8090"))
+# Pooled keep-alive HTTP client of the HTTP routing backends: timeouts are in seconds; after
+# `failure_threshold` consecutive failed calls, calls fail fast for `reset_timeout` seconds
+ROUTING_HTTP_OPTIONS = {
+    'pool_size': 10,
+    # Per event loop, for the async route endpoint
+    'async_pool_size': 100,
+    'connect_timeout': 3.05,
+    'read_timeout': 20,
+    'retries': 2,
+    'backoff': 0.25,
+    'failure_threshold': 5,
+    'reset_timeout': 30,
+}
+ROUTING_BACKENDS = {
+    'openrouteservice': {
+        'backend': 'openrouteservice',
+        'api_key': ORS_API_KEY,
+        'base_url': os.getenv("ORS_BASE_URL", "https://api.openrouteservice.org"),
+        **ROUTING_HTTP_OPTIONS,
+    },
+    'offline': {'backend': 'offline'},
+    'stub': {
+        'backend': 'openrouteservice',
+        'base_url': f"http://{ROUTING_STUB_HOST}:{ROUTING_STUB_PORT}",
+        **ROUTING_HTTP_OPTIONS,
+    },
+}
+
+# Seconds a directions request waits on another worker fetching the same route before fetching it itself
+# (and how long the fetching worker holds its lock): the longest a routing call can take, with every attempt
+# timing out after the longest backoffs (up to 1.5x `backoff`, doubling per retry), plus some slack
+DIRECTIONS_SINGLEFLIGHT_TIMEOUT = math.ceil(
+    (ROUTING_HTTP_OPTIONS['retries'] + 1)
+    * (ROUTING_HTTP_OPTIONS['connect_timeout'] + ROUTING_HTTP_OPTIONS['read_timeout'])
+    + 1.5 * ROUTING_HTTP_OPTIONS['backoff'] * (2 ** ROUTING_HTTP_OPTIONS['retries'] - 1)
+    + 5
+)
+# Directions cache key normalization: endpoints are snapped to a grid of `precision_m` metres, then to a
+# previously routed endpoint within `snap_tolerance_m` metres if there is one. Set either to None to disable it.
+DIRECTIONS_CACHE_QUANTIZATION = {
+    'precision_m': 25,
+    'snap_tolerance_m': 150,
+}
+# Store each cached route's cumulative miles alongside its geometry. Skips recomputing distances on
+# cache hits, but float64 miles take roughly 3x the space of the encoded geometry, so it is off by default.
+DIRECTIONS_CACHE_CUMULATIVE_MILES = False
+# Seconds a route stays in the shared cache (hard TTL). After DIRECTIONS_CACHE_SOFT_TIMEOUT seconds it is
+# stale: still served, but refreshed in the background by one of DIRECTIONS_REFRESH_WORKERS threads per process
+DIRECTIONS_CACHE_TIMEOUT = 3600
+DIRECTIONS_CACHE_SOFT_TIMEOUT = 600
+DIRECTIONS_REFRESH_WORKERS = 2
+# Per-process tier in front of the shared cache, holding decoded routes
+ROUTE_CACHE_LOCAL_MAX_ENTRIES = 256
+ROUTE_CACHE_LOCAL_MAX_BYTES = 64 * 1024 * 1024
+ROUTE_CACHE_LOCAL_TTL = 300
+# Seconds a complete /api/route/ response is cached (keyed on lane, vehicle and fuel price dataset version),
+# at most until its route goes stale (DIRECTIONS_CACHE_SOFT_TIMEOUT)
+ROUTE_RESPONSE_CACHE_TIMEOUT = 3600
+
+# Threads per process for the CPU-bound steps (route decoding, distances, planning) of /api/route/async/
+ROUTE_CPU_WORKERS = int(os.getenv("ROUTE_CPU_WORKERS", "4"))
+
+# POST /api/routes/batch: most lanes accepted per call, and routes fetched and planned at once per call
+ROUTE_BATCH_MAX_LANES = 10000
+ROUTE_BATCH_CONCURRENCY = int(os.getenv("ROUTE_BATCH_CONCURRENCY", "16"))
+# POST /api/routes/matrix: most origin x destination cells per call (planned with ROUTE_BATCH_CONCURRENCY)
+ROUTE_MATRIX_MAX_CELLS = 2500
+
+# Distance model for route geometry: 'haversine' (fast, spherical) or 'ellipsoidal' (WGS-84)
+ROUTE_DISTANCE_METHOD = os.getenv("ROUTE_DISTANCE_METHOD", "haversine")
+# Maximum distance (miles) a fuel station may be off the route to be considered
+FUEL_CORRIDOR_RADIUS_MILES = 10
+# Where corridor stations come from: 'index' (in-process station index) or 'database' (PostGIS query)
+FUEL_STATION_SOURCE = os.getenv("FUEL_STATION_SOURCE", "index")
+# How often (seconds) a worker checks whether the fuel price dataset version changed
+STATION_INDEX_VERSION_CHECK_SECONDS = 30
+# Memory-mapped station snapshot written by `manage.py build_station_snapshot`; unset to load from the database
+STATION_SNAPSHOT_PATH = os.getenv("STATION_SNAPSHOT_PATH")
+
 ROOT_URLCONF = 'fuel_route.urls'
 
 TEMPLATES = [